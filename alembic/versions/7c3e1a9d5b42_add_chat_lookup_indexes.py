@@ -0,0 +1,77 @@
+"""add chat lookup indexes, one session per user
+
+Revision ID: 7c3e1a9d5b42
+Revises: 02db5ff543f4
+Create Date: 2026-10-18 10:12:31.504118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e1a9d5b42'
+down_revision: Union[str, None] = '02db5ff543f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Users may already have several sessions: keep the oldest one and move
+    # the messages of the others onto it before enforcing uniqueness
+    op.execute(
+        """
+        UPDATE chat_messages AS m
+        SET session_id = d.keep_id
+        FROM (
+            SELECT id, MIN(id) OVER (PARTITION BY user_email) AS keep_id
+            FROM chat_sessions
+        ) AS d
+        WHERE m.session_id = d.id AND d.id <> d.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM chat_sessions AS s
+        USING (
+            SELECT id, MIN(id) OVER (PARTITION BY user_email) AS keep_id
+            FROM chat_sessions
+        ) AS d
+        WHERE s.id = d.id AND d.id <> d.keep_id
+        """
+    )
+    # The tables may already exist from Base.metadata.create_all, with a
+    # non-unique index on user_email or none at all
+    op.drop_index(
+        op.f('ix_chat_sessions_user_email'),
+        table_name='chat_sessions',
+        if_exists=True,
+    )
+    op.create_index(
+        op.f('ix_chat_sessions_user_email'),
+        'chat_sessions',
+        ['user_email'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_chat_messages_session_id_created_at',
+        'chat_messages',
+        ['session_id', 'created_at'],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_chat_messages_session_id_created_at',
+        table_name='chat_messages',
+        if_exists=True,
+    )
+    op.drop_index(
+        op.f('ix_chat_sessions_user_email'),
+        table_name='chat_sessions',
+        if_exists=True,
+    )
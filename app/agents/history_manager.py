@@ -0,0 +1,195 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+from app.clients.llm.azure_openai import AzureOpenAIClient
+from app.agents.prompts import HISTORY_SUMMARY_PROMPT
+from app.agents.result_formatter import estimate_tokens
+from app.entities.schema.chat_messages_schema import (
+    ChatMessageCreateSchema,
+    ChatMessageSchema,
+)
+from app.core.config import settings
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Keys used on ChatSessionModel.meta_data
+SUMMARY_KEY = "history_summary"
+# Id of the newest message already folded into the summary
+SUMMARY_UNTIL_KEY = "history_summary_until"
+
+SUMMARY_SYSTEM_MESSAGE = {"role": "system", "content": HISTORY_SUMMARY_PROMPT}
+
+
+class HistoryWindow:
+    """Bounded history for one prompt, plus the older messages still to summarize"""
+
+    def __init__(
+        self,
+        session_id: Optional[int] = None,
+        meta_data: Optional[Dict[str, Any]] = None,
+        messages: List[Dict[str, Any]] = None,
+        pending: List[ChatMessageSchema] = None,
+        truncated: bool = False,
+    ):
+        self.session_id = session_id
+        self.meta_data = meta_data or {}
+        # Prompt-ready messages: the rolling summary, then the most recent turns
+        self.messages = messages or []
+        # Messages that fell out of the window and are not in the summary yet
+        self.pending = pending or []
+        # The stored messages were capped and may not reach back to the
+        # summary, so pending can miss older unsummarized messages
+        self.truncated = truncated
+
+    @property
+    def summary(self) -> Optional[str]:
+        return self.meta_data.get(SUMMARY_KEY)
+
+    @property
+    def summarized_until(self) -> int:
+        return self.meta_data.get(SUMMARY_UNTIL_KEY) or 0
+
+
+class HistoryManager:
+    """Keeps per-request history within a message count and token budget.
+
+    The most recent messages are sent verbatim; older ones are folded into a
+    rolling summary stored on the session, updated in the background.
+    """
+
+    def __init__(
+        self,
+        llm_client: AzureOpenAIClient,
+        max_messages: int = None,
+        token_budget: int = None,
+        fetch_limit: int = None,
+    ):
+        self.llm_client = llm_client
+        self.max_messages = max_messages or settings.HISTORY_MAX_MESSAGES
+        self.token_budget = token_budget or settings.HISTORY_TOKEN_BUDGET
+        self.fetch_limit = fetch_limit or settings.HISTORY_FETCH_MESSAGES
+        self._summarizing: Set[int] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def build_window(
+        self,
+        session_id: int,
+        meta_data: Optional[Dict[str, Any]],
+        messages: List[ChatMessageSchema],
+        unsaved: Sequence[ChatMessageCreateSchema] = (),
+    ) -> HistoryWindow:
+        """Select the newest messages that fit.
+
+        messages are the stored ones (at most fetch_limit of the newest) and
+        unsaved those still waiting to be written, both in chronological order.
+        """
+        window = HistoryWindow(session_id, meta_data)
+        window.truncated = (
+            len(messages) >= self.fetch_limit and messages[0].id > window.summarized_until
+        )
+        unsummarized = [m for m in messages if m.id > window.summarized_until]
+        unsummarized.extend(unsaved)
+
+        budget = self.token_budget
+        if window.summary:
+            summary_message = {
+                "role": "system",
+                "content": f"Summary of the earlier conversation: {window.summary}",
+            }
+            budget -= estimate_tokens(summary_message["content"])
+
+        keep = 0
+        for message in reversed(unsummarized):
+            cost = estimate_tokens(message.content)
+            if keep >= self.max_messages or cost > budget:
+                break
+            budget -= cost
+            keep += 1
+
+        dropped = unsummarized[: len(unsummarized) - keep]
+        recent = unsummarized[len(unsummarized) - keep:]
+        # Unsaved messages have no id yet, they are summarized once persisted
+        window.pending = [m for m in dropped if hasattr(m, "id")]
+        if window.summary:
+            window.messages.append(summary_message)
+        window.messages.extend({"role": m.role, "content": m.content} for m in recent)
+        return window
+
+    async def summarize(
+        self, summary: Optional[str], messages: List[ChatMessageSchema]
+    ) -> Optional[str]:
+        """Fold messages into the previous summary; None if the LLM call failed"""
+        transcript = "\n".join(f"{m.role}: {m.content}" for m in messages)
+        response = await self.llm_client.get_response_async(
+            [
+                SUMMARY_SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": f"Previous summary: {summary or '(none)'}\n"
+                    f"New messages:\n{transcript}\nUpdated summary:",
+                },
+            ],
+            max_tokens=settings.HISTORY_SUMMARY_MAX_TOKENS,
+            temperature=0.2,
+        )
+        if response.startswith("Error generating response:"):
+            logger.error(f"History summarization failed: {response}")
+            return None
+        return response.strip()
+
+    def schedule_summary(
+        self,
+        window: HistoryWindow,
+        save: Callable[[int, Dict[str, Any]], Awaitable[None]],
+        load: Callable[[int, int, int], Awaitable[List[ChatMessageSchema]]],
+    ) -> None:
+        """Update the session summary in the background when messages fell out of the window.
+
+        save(session_id, meta_data) persists the new meta_data. When the window
+        is truncated, load(session_id, after_id, up_to_id) reads the stored
+        messages to summarize instead, oldest first and possibly capped; the
+        summary then only advances up to the last message it returned.
+        """
+        if window.session_id is None or not window.pending:
+            return
+        if window.session_id in self._summarizing:
+            return
+        self._summarizing.add(window.session_id)
+
+        async def refresh():
+            try:
+                pending = window.pending
+                if window.truncated:
+                    pending = await load(
+                        window.session_id, window.summarized_until, pending[-1].id
+                    )
+                    if not pending:
+                        return
+                summary = await self.summarize(window.summary, pending)
+                if summary is None:
+                    return
+                meta_data = {
+                    **window.meta_data,
+                    SUMMARY_KEY: summary,
+                    SUMMARY_UNTIL_KEY: pending[-1].id,
+                }
+                await save(window.session_id, meta_data)
+                logger.info(
+                    f"Summarized {len(pending)} message(s) of session {window.session_id}"
+                )
+            except Exception as e:
+                logger.error(f"Could not update history summary: {e}")
+            finally:
+                self._summarizing.discard(window.session_id)
+
+        task = asyncio.create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def shutdown(self, timeout: float = 10) -> None:
+        """Give running summarizations a chance to finish, then cancel them"""
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
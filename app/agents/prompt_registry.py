@@ -0,0 +1,101 @@
+import asyncio
+from typing import Callable, Dict, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.agents.prompts import RESPONSE_GENERATOR_PROMPT, SQL_GENERATOR_PROMPT
+from app.cache.sql_query_cache import prompt_version
+from app.clients.db.postgres_client import AsyncSessionLocal
+from app.entities.models.prompts import PromptType
+from app.entities.repositories.prompts_repo import AsyncPromptsRepo
+from app.core.config import settings
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Used for any type without an active row in the prompts table
+DEFAULT_PROMPTS: Dict[PromptType, str] = {
+    PromptType.SQL_GENERATOR: SQL_GENERATOR_PROMPT,
+    PromptType.RESPONSE_GENERATOR: RESPONSE_GENERATOR_PROMPT,
+}
+
+
+class ActivePrompt:
+    """Prompt text in use for a type, with a fingerprint of its content"""
+
+    __slots__ = ("type", "text", "version")
+
+    def __init__(self, type: PromptType, text: str):
+        self.type = type
+        self.text = text
+        self.version = prompt_version(text)
+
+
+class PromptRegistry:
+    """Active prompts kept in memory so agents never query them per request.
+
+    start() loads the newest active prompt of each type and then reloads
+    them every refresh_interval seconds, replacing the whole mapping when
+    something changed. Types missing from the database, or every type while
+    the database is unreachable, use the static prompts in app.agents.prompts.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = None,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.refresh_interval = refresh_interval or settings.PROMPT_REFRESH_INTERVAL
+        self.session_factory = session_factory
+        self.repository = AsyncPromptsRepo()
+        self._prompts: Dict[PromptType, ActivePrompt] = {
+            type: ActivePrompt(type, text) for type, text in DEFAULT_PROMPTS.items()
+        }
+        self._task: Optional[asyncio.Task] = None
+
+    def get(self, type: PromptType) -> ActivePrompt:
+        return self._prompts[type]
+
+    async def load(self) -> bool:
+        """Reload the active prompts; True if any of them changed"""
+        async with self.session_factory() as db:
+            rows = await self.repository.get_active_prompts(db)
+        texts = dict(DEFAULT_PROMPTS)
+        # Rows are newest first, keep the first one of each type
+        for row in reversed(rows):
+            texts[row.type] = row.prompt
+        prompts = {
+            type: self._prompts[type]
+            if type in self._prompts and self._prompts[type].text == text
+            else ActivePrompt(type, text)
+            for type, text in texts.items()
+        }
+        changed = [type.value for type in prompts if prompts[type] is not self._prompts.get(type)]
+        if changed:
+            self._prompts = prompts
+            logger.info(f"Loaded prompt(s): {', '.join(changed)}")
+        return bool(changed)
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.load()
+            except Exception as e:
+                logger.warning(f"Prompt reload failed, keeping current prompts: {e}")
+
+    async def start(self) -> None:
+        """Load the prompts and start polling for changes"""
+        try:
+            await self.load()
+        except Exception as e:
+            logger.error(f"Could not load prompts, using the built-in ones: {e}")
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -251,3 +251,16 @@ Guidelines:
 
 Format your response as natural conversation, as if you're speaking to a business stakeholder.
 """
+
+HISTORY_SUMMARY_PROMPT = """
+You maintain a running summary of a conversation between a business user and a data assistant.
+
+Guidelines:
+- Merge the previous summary with the new messages into a single updated summary
+- Keep the questions asked, the stores, products, periods and figures mentioned, and any preferences the user stated
+- Drop greetings and small talk
+- Write in the language of the conversation
+- Keep it under 200 words
+
+Return only the updated summary text.
+"""
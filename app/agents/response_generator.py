@@ -1,29 +1,50 @@
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Any
 from sqlalchemy.orm import Session
 from app.clients.llm.azure_openai import AzureOpenAIClient
 from app.entities.schema.agent_response_schema import ChatResponse
-from app.agents.prompts import RESPONSE_GENERATOR_PROMPT
+from app.entities.models.prompts import PromptType
+from app.agents.prompt_registry import PromptRegistry
 import json
 
+# Output instructions appended after the prompt, rendered once
+JSON_RESPONSE_FORMAT = f"Respond in JSON format: {json.dumps(ChatResponse.model_json_schema())}"
+PLAIN_TEXT_RESPONSE_FORMAT = (
+    "Respond with the plain text answer only, no JSON or markdown code blocks."
+)
+
+
+@lru_cache(maxsize=16)
+def system_message(prompt_text: str, response_format: str) -> Dict[str, str]:
+    """System message for a prompt version and output format, built once.
+
+    Shared by every call and kept byte-identical so the provider can reuse
+    its cached prompt prefix. Callers must not modify it.
+    """
+    return {"role": "system", "content": f"{prompt_text}\n\n{response_format}"}
+
 
 class ResponseGeneratorAgent:
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        llm_client: AzureOpenAIClient,
+        prompt_registry: PromptRegistry = None,
+    ):
         self.db = db
-        self.llm_client = AzureOpenAIClient()
+        self.llm_client = llm_client
+        self.prompt_registry = prompt_registry or PromptRegistry()
 
-    async def generate_response(
+    def _build_messages(
         self,
+        response_format: str,
         user_message: str,
         sql_results: str,
         message_history: List[Dict[str, Any]] = None,
-    ) -> ChatResponse:
-        """Generate natural language response from SQL results with message history"""
-        messages = [
-            {
-                "role": "system",
-                "content": f"{RESPONSE_GENERATOR_PROMPT}\n\nRespond in JSON format: {json.dumps(ChatResponse.model_json_schema())}",
-            }
-        ]
+    ) -> List[Dict[str, Any]]:
+        # Stable prefix first (system message, then history), per-request content last
+        prompt = self.prompt_registry.get(PromptType.RESPONSE_GENERATOR)
+        messages = [system_message(prompt.text, response_format)]
 
         # Add message history if provided
         if message_history:
@@ -35,6 +56,21 @@ class ResponseGeneratorAgent:
                 "content": f"User asked: {user_message}\nSQL Results: {sql_results}\nGenerate response:",
             }
         )
+        return messages
+
+    async def generate_response(
+        self,
+        user_message: str,
+        sql_results: str,
+        message_history: List[Dict[str, Any]] = None,
+    ) -> ChatResponse:
+        """Generate natural language response from SQL results with message history"""
+        messages = self._build_messages(
+            JSON_RESPONSE_FORMAT,
+            user_message,
+            sql_results,
+            message_history,
+        )
 
         response = await self.llm_client.get_response_async(messages)
         # Clean response - remove markdown code blocks if present
@@ -46,3 +82,19 @@ class ResponseGeneratorAgent:
         cleaned_response = cleaned_response.strip()
 
         return ChatResponse.model_validate_json(cleaned_response)
+
+    async def stream_response(
+        self,
+        user_message: str,
+        sql_results: str,
+        message_history: List[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """Stream the natural language response token by token as plain text"""
+        messages = self._build_messages(
+            PLAIN_TEXT_RESPONSE_FORMAT,
+            user_message,
+            sql_results,
+            message_history,
+        )
+        async for token in self.llm_client.stream_response_async(messages):
+            yield token
@@ -0,0 +1,113 @@
+import csv
+import io
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List
+from app.clients.db.query_result import ColumnarResult
+from app.core.config import settings
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), good enough for budgeting"""
+    return len(text) // 4 + 1
+
+
+def format_value(value: Any) -> str:
+    """Short plain-text rendering of a result value"""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return format(value, ".12g")
+    if isinstance(value, Decimal):
+        return format(value, "f")
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def csv_lines(result: ColumnarResult) -> List[str]:
+    """CSV header followed by one line per row"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(result.columns)
+    for row in result.rows():
+        writer.writerow([format_value(value) for value in row])
+    return buffer.getvalue().splitlines()
+
+
+def summary_lines(aggregates: Dict[str, Dict[str, Any]]) -> List[str]:
+    """One line of aggregates per column (see ColumnStats.summary)"""
+    lines = []
+    for name, stats in aggregates.items():
+        parts = []
+        if "sum" in stats:
+            parts.append(f"sum={format_value(stats['sum'])}")
+        if "min" in stats:
+            parts.append(f"min={format_value(stats['min'])}, max={format_value(stats['max'])}")
+        if "top" in stats:
+            top = ", ".join(f"{format_value(value)} ({count})" for value, count in stats["top"])
+            parts.append(f"{stats['distinct']} distinct, top: {top}")
+        if stats["nulls"]:
+            parts.append(f"nulls={stats['nulls']}")
+        lines.append(f"- {name} ({stats['type']}): {'; '.join(parts)}")
+    return lines
+
+
+class ResultFormatter:
+    """Renders query results for the response prompt within a token budget.
+
+    Small results are sent as a CSV table. Larger ones get per-column
+    aggregates plus as many leading rows as still fit the budget. Aggregates
+    always cover every row: they come from the query execution, or from
+    the data itself when it holds the whole result, and are left out
+    otherwise so sample totals are never presented as real ones.
+    """
+
+    def __init__(self, token_budget: int = None, top_k: int = None):
+        self.token_budget = token_budget or settings.RESULT_PROMPT_TOKEN_BUDGET
+        self.top_k = top_k or settings.RESULT_SUMMARY_TOP_K
+
+    def format(self, query_result: Dict[str, Any]) -> str:
+        if not query_result["success"]:
+            return f"Query failed: {query_result['error']}"
+
+        data: ColumnarResult = query_result["data"]
+        row_count = query_result.get("row_count", len(data))
+        if not len(data):
+            return "Query returned no rows."
+
+        table = csv_lines(data)
+        if len(data) == row_count:
+            text = "\n".join([f"{row_count} row(s):", *table])
+            if estimate_tokens(text) <= self.token_budget:
+                return text
+
+        aggregates = query_result.get("aggregates")
+        if aggregates is None and len(data) == row_count:
+            aggregates = data.summary(self.top_k)
+        if aggregates is not None:
+            scope = f"{row_count} row(s); aggregates over all rows:"
+        else:
+            scope = f"{row_count} row(s); only the first {len(data)} were fetched:"
+        # Budget in characters; each line also costs its newline
+        remaining = self.token_budget * 4 - len(scope)
+        lines = [scope]
+        for line in summary_lines(aggregates or {}):
+            if len(line) + 1 > remaining:
+                break
+            lines.append(line)
+            remaining -= len(line) + 1
+
+        # Fill the rest of the budget with the leading rows
+        rows_header = f"First rows:\n{table[0]}"
+        if len(rows_header) + len(table[1]) + 2 <= remaining:
+            lines.append(rows_header)
+            remaining -= len(rows_header) + 1
+            for line in table[1:]:
+                if len(line) + 1 > remaining:
+                    break
+                lines.append(line)
+                remaining -= len(line) + 1
+        return "\n".join(lines)
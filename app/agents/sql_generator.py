@@ -1,24 +1,56 @@
+from functools import lru_cache
+from typing import Dict
 from sqlalchemy.orm import Session
 from app.clients.llm.azure_openai import AzureOpenAIClient
+from app.cache.sql_query_cache import SQLQueryCache
+from app.entities.models.prompts import PromptType
 from app.entities.schema.agent_response_schema import SQLQueryResponse
-from app.agents.prompts import SQL_GENERATOR_PROMPT
+from app.agents.prompt_registry import PromptRegistry
+from app.monitoring.logging import get_logger
 import json
 
+logger = get_logger(__name__)
+
+# The schema never changes at runtime, render it once
+RESPONSE_FORMAT = f"Respond in JSON format: {json.dumps(SQLQueryResponse.model_json_schema())}"
+
+
+@lru_cache(maxsize=8)
+def system_message(prompt_text: str) -> Dict[str, str]:
+    """System message for a prompt version, built once and shared by every call.
+
+    It stays first and byte-identical between calls so the provider can
+    reuse its cached prompt prefix. Callers must not modify it.
+    """
+    return {"role": "system", "content": f"{prompt_text}\n\n{RESPONSE_FORMAT}"}
+
 
 class SQLGeneratorAgent:
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        llm_client: AzureOpenAIClient,
+        sql_cache: SQLQueryCache = None,
+        prompt_registry: PromptRegistry = None,
+    ):
         self.db = db
-        self.llm_client = AzureOpenAIClient()
+        self.llm_client = llm_client
+        self.sql_cache = sql_cache
+        self.prompt_registry = prompt_registry or PromptRegistry()
 
     async def generate_sql_query(
         self, user_message: str
     ) -> SQLQueryResponse:
-        """Generate SQL query from user message"""
+        """Generate SQL query from user message, reusing cached SQL for repeat questions"""
+        prompt = self.prompt_registry.get(PromptType.SQL_GENERATOR)
+        if self.sql_cache:
+            cached = await self.sql_cache.get(user_message, prompt.version)
+            if cached is not None:
+                logger.info("Serving SQL query from cache")
+                return cached
+
         messages = [
-            {
-                "role": "system",
-                "content": f"{SQL_GENERATOR_PROMPT}\n\nRespond in JSON format: {json.dumps(SQLQueryResponse.model_json_schema())}",
-            },
+            system_message(prompt.text),
             {"role": "user", "content": f"Generate SQL for: {user_message}"},
         ]
 
@@ -31,4 +63,7 @@ class SQLGeneratorAgent:
             cleaned_response = cleaned_response[:-3]  # Remove ```
         cleaned_response = cleaned_response.strip()
 
-        return SQLQueryResponse.model_validate_json(cleaned_response)
+        sql_response = SQLQueryResponse.model_validate_json(cleaned_response)
+        if self.sql_cache:
+            await self.sql_cache.set(user_message, prompt.version, sql_response)
+        return sql_response
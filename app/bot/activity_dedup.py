@@ -0,0 +1,175 @@
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Optional
+from weakref import WeakValueDictionary
+from fastapi import Request
+from app.core.config import settings
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+Compute = Callable[[], Awaitable[str]]
+Deliver = Callable[[str], Awaitable[None]]
+
+
+class ActivityDeduplicator(ABC):
+    """Runs each activity at most once within a TTL window.
+
+    run() computes and delivers the reply for the first delivery of an
+    activity. Redeliveries attach to the in-flight computation or reuse the
+    finished reply; they re-send it only if the original delivery failed.
+    """
+
+    @abstractmethod
+    async def run(self, activity_key: str, compute: Compute, deliver: Deliver) -> bool:
+        """Process the activity; returns True when it was a duplicate"""
+
+
+class _Entry:
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+        # Resolves with the reply once the original turn attempted delivery
+        self.done: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.delivered = False
+
+
+class InMemoryActivityDeduplicator(ActivityDeduplicator):
+    def __init__(self, ttl: float = 600, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[str, _Entry] = {}
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        # Dicts keep insertion order, so the oldest entries go first
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    async def run(self, activity_key: str, compute: Compute, deliver: Deliver) -> bool:
+        self._prune()
+        entry = self._entries.get(activity_key)
+        if entry is not None:
+            logger.info(f"Duplicate activity {activity_key}, reusing its reply")
+            try:
+                reply = await asyncio.shield(entry.done)
+            except RuntimeError:
+                # The original turn failed and already reported it to the user
+                return True
+            if not entry.delivered:
+                await deliver(reply)
+                entry.delivered = True
+            return True
+
+        entry = self._entries[activity_key] = _Entry(time.monotonic() + self.ttl)
+        try:
+            reply = await compute()
+        except BaseException:
+            # Let a later redelivery try again from scratch
+            self._entries.pop(activity_key, None)
+            entry.done.set_exception(RuntimeError(f"Activity {activity_key} failed"))
+            entry.done.exception()  # Mark retrieved so unattached failures are not logged
+            raise
+        try:
+            await deliver(reply)
+            entry.delivered = True
+        finally:
+            entry.done.set_result(reply)
+        return False
+
+
+class RedisActivityDeduplicator(ActivityDeduplicator):
+    """Cross-worker deduplication backed by Redis claims and stored replies"""
+
+    def __init__(
+        self,
+        redis_client,
+        ttl: float = 600,
+        wait_timeout: float = 120,
+        poll_interval: float = 0.5,
+    ):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        # Serializes duplicates inside this process so they reuse the stored reply
+        self._locks: "WeakValueDictionary[str, asyncio.Lock]" = WeakValueDictionary()
+
+    def _key(self, activity_key: str) -> str:
+        return f"spassu:activity:{activity_key}"
+
+    async def _store(self, activity_key: str, reply: str, delivered: bool) -> None:
+        record = json.dumps({"status": "done", "reply": reply, "delivered": delivered})
+        await self.redis.set(self._key(activity_key), record, ex=int(self.ttl))
+
+    async def _wait_for_record(self, activity_key: str) -> Optional[dict]:
+        """Poll until the claiming worker stores its reply; None if the claim was released"""
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            raw = await self.redis.get(self._key(activity_key))
+            if raw is None:
+                return None
+            record = json.loads(raw)
+            if record.get("status") == "done" or time.monotonic() >= deadline:
+                return record
+            await asyncio.sleep(self.poll_interval)
+
+    async def run(self, activity_key: str, compute: Compute, deliver: Deliver) -> bool:
+        lock = self._locks.get(activity_key)
+        if lock is None:
+            lock = self._locks[activity_key] = asyncio.Lock()
+        async with lock:
+            return await self._run(activity_key, compute, deliver)
+
+    async def _run(self, activity_key: str, compute: Compute, deliver: Deliver) -> bool:
+        claimed = await self.redis.set(
+            self._key(activity_key),
+            json.dumps({"status": "pending"}),
+            nx=True,
+            ex=int(self.ttl),
+        )
+        if not claimed:
+            logger.info(f"Duplicate activity {activity_key}, reusing its reply")
+            record = await self._wait_for_record(activity_key)
+            if record is None:
+                # The original attempt failed and released its claim, try again here
+                return await self._run(activity_key, compute, deliver)
+            if record["status"] != "done":
+                logger.warning(
+                    f"Timed out waiting for activity {activity_key}, skipping duplicate"
+                )
+            elif not record["delivered"]:
+                await deliver(record["reply"])
+                await self._store(activity_key, record["reply"], delivered=True)
+            return True
+
+        try:
+            reply = await compute()
+        except BaseException:
+            await self.redis.delete(self._key(activity_key))
+            raise
+        try:
+            await deliver(reply)
+        except BaseException:
+            await self._store(activity_key, reply, delivered=False)
+            raise
+        await self._store(activity_key, reply, delivered=True)
+        return False
+
+
+def build_activity_deduplicator() -> ActivityDeduplicator:
+    """Create the deduplicator selected by settings.CACHE_BACKEND"""
+    if settings.CACHE_BACKEND == "redis":
+        from app.clients.cache.redis_client import get_redis_client
+
+        return RedisActivityDeduplicator(get_redis_client(), ttl=settings.BOT_DEDUP_TTL)
+    return InMemoryActivityDeduplicator(ttl=settings.BOT_DEDUP_TTL)
+
+
+# Dependency
+def get_activity_deduplicator(request: Request) -> ActivityDeduplicator:
+    return request.app.state.activity_deduplicator
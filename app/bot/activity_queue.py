@@ -0,0 +1,76 @@
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Set
+from fastapi import Request
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+
+class ConversationWorkQueue:
+    """Background worker pool that processes jobs strictly in order per conversation.
+
+    Jobs for different conversations run concurrently, bounded by max_workers;
+    jobs sharing a key run one after another in submission order.
+    """
+
+    def __init__(self, max_workers: int = 16, max_pending: int = 1000):
+        self.max_pending = max_pending
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._queues: Dict[str, Deque[Job]] = {}
+        self._drainers: Set[asyncio.Task] = set()
+        self._pending = 0
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def submit(self, key: str, job: Job) -> bool:
+        """Enqueue a job; returns False when the queue is full or shutting down"""
+        if self._closed or self._pending >= self.max_pending:
+            return False
+        self._pending += 1
+        queue = self._queues.get(key)
+        if queue is None:
+            # No drainer for this conversation yet, start one
+            queue = self._queues[key] = deque()
+            queue.append(job)
+            task = asyncio.create_task(self._drain(key, queue))
+            self._drainers.add(task)
+            task.add_done_callback(self._drainers.discard)
+        else:
+            queue.append(job)
+        return True
+
+    async def _drain(self, key: str, queue: Deque[Job]) -> None:
+        try:
+            while queue:
+                job = queue.popleft()
+                try:
+                    async with self._semaphore:
+                        await job()
+                except Exception as e:
+                    logger.error(f"Background job for conversation {key} failed: {e}")
+                finally:
+                    self._pending -= 1
+        finally:
+            self._queues.pop(key, None)
+
+    async def shutdown(self, timeout: float = 30) -> None:
+        """Stop accepting jobs and wait for queued ones to finish"""
+        self._closed = True
+        if not self._drainers:
+            return
+        done, pending = await asyncio.wait(set(self._drainers), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(f"Cancelled {len(pending)} conversation(s) still processing at shutdown")
+
+
+# Dependency
+def get_bot_work_queue(request: Request) -> ConversationWorkQueue:
+    return request.app.state.bot_work_queue
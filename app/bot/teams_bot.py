@@ -1,28 +1,123 @@
-from botbuilder.core import ActivityHandler, TurnContext
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+from botbuilder.core import ActivityHandler, MessageFactory, TurnContext
 from botbuilder.schema import Activity, ActivityTypes
 from sqlalchemy.orm import Session
+from app.clients.registry import ClientRegistry
+from app.bot.activity_dedup import ActivityDeduplicator
 from app.entities.services.conversations_service import ConversationsService
 from app.monitoring.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Teams hides the typing indicator after a few seconds, so it is re-sent periodically
+TYPING_INTERVAL_SECONDS = 3
+
+STATUS_MESSAGES = {
+    "received": "Recebi sua pergunta, analisando...",
+    "generating_sql": "Montando a consulta...",
+    "querying": "Consultando os dados...",
+    "generating_response": "Preparando a resposta...",
+}
+
+
+def describe_progress(event: Dict[str, Any]) -> Optional[str]:
+    """Interim status text shown to the user for a pipeline progress event"""
+    if event["event"] == "status":
+        return STATUS_MESSAGES.get(event["stage"])
+    if event["event"] == "rows" and event.get("success"):
+        return f"Encontrei {event['row_count']} registro(s), preparando a resposta..."
+    return None
+
 
 class TeamsBot(ActivityHandler):
     """Simple bot to handle 1:1 chat messages from Teams."""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        clients: ClientRegistry,
+        deduplicator: ActivityDeduplicator = None,
+    ):
         self.db = db
-        self.conversations_service = ConversationsService(db)
+        self.conversations_service = ConversationsService(db, clients)
+        self.deduplicator = deduplicator
+
+    async def _keep_typing(self, turn_context: TurnContext) -> None:
+        """Re-send the typing activity until cancelled"""
+        while True:
+            await asyncio.sleep(TYPING_INTERVAL_SECONDS)
+            await turn_context.send_activity(Activity(type=ActivityTypes.typing))
+
+    async def _update_status(
+        self, turn_context: TurnContext, activity_id: Optional[str], text: str
+    ) -> Optional[str]:
+        """Replace the status message in place, falling back to a new message"""
+        if activity_id:
+            activity = MessageFactory.text(text)
+            activity.id = activity_id
+            try:
+                await turn_context.update_activity(activity)
+                return activity_id
+            except Exception as e:
+                logger.warning(f"Could not update status message, sending a new one: {e}")
+        response = await turn_context.send_activity(text)
+        return response.id if response else None
+
+    async def _answer_with_progress(
+        self, turn_context: TurnContext, message_text: str, user_email: str
+    ) -> Tuple[str, Optional[str]]:
+        """Compute the answer while showing typing and an interim status message.
+
+        Returns the answer and the id of the status message it should replace.
+        """
+        status_updates: asyncio.Queue = asyncio.Queue()
+        status_task = None
+        await turn_context.send_activity(Activity(type=ActivityTypes.typing))
+        typing_task = asyncio.create_task(self._keep_typing(turn_context))
+        try:
+            status = await turn_context.send_activity(STATUS_MESSAGES["received"])
+            status_id = status.id if status else None
+
+            async def apply_status_updates():
+                nonlocal status_id
+                while True:
+                    text = await status_updates.get()
+                    status_id = await self._update_status(turn_context, status_id, text)
+
+            def on_progress(event: Dict[str, Any]) -> None:
+                text = describe_progress(event)
+                if text:
+                    status_updates.put_nowait(text)
+
+            status_task = asyncio.create_task(apply_status_updates())
+
+            # Use existing conversation service to generate response
+            response = await self.conversations_service.answer(
+                message_text, user_email, on_progress=on_progress
+            )
+        finally:
+            tasks = [task for task in (status_task, typing_task) if task]
+            for task in tasks:
+                task.cancel()
+            # Wait for the tasks to stop so an in-flight status update cannot
+            # land after the answer or change status_id once it is returned
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return response, status_id
 
     async def on_message_activity(self, turn_context: TurnContext):
         """
         Handle incoming message activities from Teams.
         Extracts user info and message, sends to conversation service.
+        Shows typing and an interim status message that is edited in place
+        as the pipeline advances and finally replaced by the answer.
+        Redelivered activities reuse the reply of the original delivery.
         """
         try:
+            activity = turn_context.activity
             # Get user email from Teams activity
-            user_email = turn_context.activity.from_property.aad_object_id or turn_context.activity.from_property.id
-            message_text = turn_context.activity.text
+            user_email = activity.from_property.aad_object_id or activity.from_property.id
+            message_text = activity.text
 
             # Ignore system/debug messages from Bot Framework Emulator
             if message_text and message_text.startswith("/INSPECT"):
@@ -31,11 +126,25 @@ class TeamsBot(ActivityHandler):
 
             logger.info(f"Received message from Teams user: {user_email}, message: {message_text}")
 
-            # Use existing conversation service to generate response
-            response = await self.conversations_service.answer(message_text, user_email)
+            status_id = None
+
+            async def compute() -> str:
+                nonlocal status_id
+                response, status_id = await self._answer_with_progress(
+                    turn_context, message_text, user_email
+                )
+                return response
+
+            async def deliver(response: str) -> None:
+                # Replace the status message with the final answer
+                await self._update_status(turn_context, status_id, response)
 
-            # Send response back to Teams
-            await turn_context.send_activity(response)
+            if self.deduplicator and activity.id:
+                await self.deduplicator.run(
+                    f"{activity.conversation.id}:{activity.id}", compute, deliver
+                )
+            else:
+                await deliver(await compute())
 
         except Exception as e:
             logger.error(f"Error processing message: {e}")
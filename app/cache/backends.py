@@ -0,0 +1,113 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+from app.core.config import settings
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CacheBackend(ABC):
+    """Async byte-oriented key/value store with per-entry TTL"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """In-process LRU cache bounded by entry count and total payload bytes"""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = asyncio.Lock()
+
+    def _pop(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if ttl <= 0 or len(value) > self.max_bytes:
+            return
+        async with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._bytes += len(value)
+            # Evict least recently used entries until within bounds
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._pop(oldest)
+
+    async def delete(self, key: str) -> None:
+        async with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis-backed cache shared across workers; errors degrade to cache misses"""
+
+    def __init__(self, redis_client, prefix: str):
+        self.redis = redis_client
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.redis.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"Redis cache get failed: {str(e)}")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        try:
+            await self.redis.set(self._key(key), value, ex=max(1, int(ttl)))
+        except Exception as e:
+            logger.warning(f"Redis cache set failed: {str(e)}")
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.redis.delete(self._key(key))
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed: {str(e)}")
+
+
+def build_cache_backend(
+    namespace: str, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024
+) -> CacheBackend:
+    """Create the backend selected by settings.CACHE_BACKEND ("memory" or "redis")"""
+    if settings.CACHE_BACKEND == "redis":
+        from app.clients.cache.redis_client import get_redis_client
+
+        return RedisCacheBackend(get_redis_client(), prefix=f"spassu:{namespace}")
+    return InMemoryCacheBackend(max_entries=max_entries, max_bytes=max_bytes)
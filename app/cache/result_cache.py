@@ -0,0 +1,146 @@
+import hashlib
+import json
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from app.cache.backends import CacheBackend, build_cache_backend
+from app.clients.db.query_result import ColumnarResult, decode_value, encode_value
+from app.core.config import settings
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+_STRING_LITERAL = re.compile(r"('(?:''|[^'])*')")
+_LINE_COMMENT = re.compile(r"--[^\n]*")
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION_SPACES = re.compile(r"\s*([(),=<>+*/-])\s*")
+
+
+def normalize_sql(query: str) -> str:
+    """Canonical form of a SQL query used as cache key.
+
+    Comments are dropped, whitespace is collapsed and everything outside
+    string literals is upper-cased, so formatting differences in the
+    generated SQL map to the same entry.
+    """
+    parts = _STRING_LITERAL.split(query)
+    normalized = []
+    for i, part in enumerate(parts):
+        if i % 2 == 1:
+            # String literal, keep verbatim
+            normalized.append(part)
+            continue
+        part = _BLOCK_COMMENT.sub(" ", _LINE_COMMENT.sub(" ", part))
+        part = _WHITESPACE.sub(" ", part)
+        part = _PUNCTUATION_SPACES.sub(r"\1", part)
+        normalized.append(part.upper())
+    return "".join(normalized).strip().rstrip(";").strip()
+
+
+def parse_refresh_times(value: str) -> List[tuple]:
+    """Parse a comma separated list of HH:MM warehouse refresh times"""
+    times = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        hour, minute = item.split(":")
+        times.append((int(hour), int(minute)))
+    return sorted(times)
+
+
+def seconds_until_next_refresh(
+    refresh_times: List[tuple], now: Optional[datetime] = None
+) -> Optional[float]:
+    """Seconds until the next scheduled warehouse refresh, None without a schedule"""
+    if not refresh_times:
+        return None
+    now = now or datetime.now()
+    candidates = []
+    for hour, minute in refresh_times:
+        at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if at <= now:
+            at += timedelta(days=1)
+        candidates.append(at)
+    return (min(candidates) - now).total_seconds()
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, ColumnarResult):
+        return {"$type": "columnar", "value": value.to_dict()}
+    return encode_value(value)
+
+
+def _decode(obj: Dict[str, Any]) -> Any:
+    if obj.get("$type") == "columnar":
+        return ColumnarResult.from_dict(obj["value"])
+    return decode_value(obj)
+
+
+def dump_result(result: Dict[str, Any]) -> bytes:
+    """Serialize a query result to JSON (never pickle: the cache may be shared)"""
+    return json.dumps(result, default=_encode, separators=(",", ":")).encode("utf-8")
+
+
+def load_result(payload: bytes) -> Dict[str, Any]:
+    return json.loads(payload, object_hook=_decode)
+
+
+class QueryResultCache:
+    """Cache of warehouse query results keyed on the normalized SQL.
+
+    Entries expire at the next warehouse refresh (WAREHOUSE_REFRESH_TIMES),
+    capped by RESULT_CACHE_MAX_TTL. Only successful results are stored.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        max_ttl: float = None,
+        refresh_times: str = None,
+    ):
+        self.backend = backend
+        self.max_ttl = settings.RESULT_CACHE_MAX_TTL if max_ttl is None else max_ttl
+        self.refresh_times = parse_refresh_times(
+            settings.WAREHOUSE_REFRESH_TIMES if refresh_times is None else refresh_times
+        )
+
+    def key(self, query: str, max_rows: int) -> str:
+        normalized = normalize_sql(query)
+        return hashlib.sha256(f"{max_rows}:{normalized}".encode("utf-8")).hexdigest()
+
+    def ttl(self) -> float:
+        until_refresh = seconds_until_next_refresh(self.refresh_times)
+        if until_refresh is None:
+            return self.max_ttl
+        return min(self.max_ttl, until_refresh)
+
+    async def get(self, query: str, max_rows: int = 1000) -> Optional[Dict[str, Any]]:
+        payload = await self.backend.get(self.key(query, max_rows))
+        if payload is None:
+            return None
+        try:
+            return load_result(payload)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached result: {str(e)}")
+            return None
+
+    async def set(self, query: str, result: Dict[str, Any], max_rows: int = 1000) -> None:
+        if not result.get("success"):
+            return
+        try:
+            payload = dump_result(result)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Not caching result that cannot be serialized: {str(e)}")
+            return
+        await self.backend.set(self.key(query, max_rows), payload, self.ttl())
+
+
+def build_result_cache() -> QueryResultCache:
+    backend = build_cache_backend(
+        "sql-results",
+        max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+        max_bytes=settings.RESULT_CACHE_MAX_BYTES,
+    )
+    return QueryResultCache(backend)
@@ -0,0 +1,229 @@
+import asyncio
+import itertools
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from app.entities.schema.chat_sessions_schema import ChatSessionSchema
+from app.entities.schema.chat_messages_schema import ChatMessageSchema
+from app.core.config import settings
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+INVALIDATION_CHANNEL = "spassu:session-cache:invalidate"
+
+
+class _Entry:
+    def __init__(
+        self, session: ChatSessionSchema, messages: List[ChatMessageSchema], expires_at: float
+    ):
+        self.session = session
+        self.messages = messages
+        self.expires_at = expires_at
+
+
+class HotSessionCache:
+    """In-process LRU of active sessions and their latest persisted messages.
+
+    Entries are loaded from the database on a miss and then kept current:
+    the message write buffer hands over every flushed batch and summary
+    updates replace the cached meta_data. Other workers are told to drop
+    their copy through Redis pub/sub when a redis client is given.
+
+    Used from request threads and the event loop, so state is lock-guarded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = None,
+        ttl: float = None,
+        max_messages: int = None,
+        redis_client=None,
+    ):
+        self.max_entries = max_entries or settings.SESSION_CACHE_MAX_ENTRIES
+        self.ttl = ttl or settings.SESSION_CACHE_TTL
+        self.max_messages = max_messages or settings.HISTORY_FETCH_MESSAGES
+        self.redis = redis_client
+        self.worker_id = uuid.uuid4().hex
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._emails: Dict[int, str] = {}
+        # Stamp of the last change per session id, so loads that raced a
+        # change do not overwrite it (see stamp() / put())
+        self._stamps = itertools.count(1)
+        self._changed: "OrderedDict[int, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._publishes: Set[asyncio.Task] = set()
+
+    def stamp(self) -> int:
+        """Take before loading a session from the database, pass to put()"""
+        with self._lock:
+            return next(self._stamps)
+
+    def get(
+        self, user_email: str
+    ) -> Optional[Tuple[ChatSessionSchema, List[ChatMessageSchema]]]:
+        with self._lock:
+            entry = self._entries.get(user_email)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._drop(entry.session.id)
+                return None
+            self._entries.move_to_end(user_email)
+            return entry.session, list(entry.messages)
+
+    def put(
+        self,
+        user_email: str,
+        session: ChatSessionSchema,
+        messages: List[ChatMessageSchema],
+        stamp: int,
+    ) -> None:
+        """Cache a session loaded from the database, unless it changed since stamp"""
+        with self._lock:
+            if self._changed.get(session.id, 0) > stamp:
+                return
+            self._entries[user_email] = _Entry(
+                session, messages[-self.max_messages:], time.monotonic() + self.ttl
+            )
+            self._entries.move_to_end(user_email)
+            self._emails[session.id] = user_email
+            while len(self._entries) > self.max_entries:
+                _, oldest = self._entries.popitem(last=False)
+                self._emails.pop(oldest.session.id, None)
+
+    def _drop(self, session_id: int) -> None:
+        user_email = self._emails.pop(session_id, None)
+        if user_email is not None:
+            self._entries.pop(user_email, None)
+
+    def _mark_changed(self, session_ids: Iterable[int]) -> None:
+        stamp = next(self._stamps)
+        for session_id in session_ids:
+            self._changed[session_id] = stamp
+            self._changed.move_to_end(session_id)
+        # Only recent changes can race a load
+        while len(self._changed) > self.max_entries * 4:
+            self._changed.popitem(last=False)
+
+    def add_messages(self, messages: List[ChatMessageSchema]) -> None:
+        """Write-through of newly persisted messages"""
+        session_ids = {m.session_id for m in messages}
+        with self._lock:
+            self._mark_changed(session_ids)
+            for message in messages:
+                entry = self._entries.get(self._emails.get(message.session_id))
+                # A load racing the flush may already hold the message
+                if entry is not None and not (
+                    entry.messages and message.id <= entry.messages[-1].id
+                ):
+                    entry.messages.append(message)
+                    del entry.messages[: -self.max_messages]
+        self._broadcast(session_ids)
+
+    def update_meta_data(self, session_id: int, meta_data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._mark_changed([session_id])
+            entry = self._entries.get(self._emails.get(session_id))
+            if entry is not None:
+                entry.session = entry.session.model_copy(update={"meta_data": meta_data})
+        self._broadcast([session_id])
+
+    def invalidate(self, session_ids: Iterable[int]) -> None:
+        """Drop sessions from this worker's cache"""
+        with self._lock:
+            session_ids = list(session_ids)
+            self._mark_changed(session_ids)
+            for session_id in session_ids:
+                self._drop(session_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mark_changed(list(self._emails))
+            self._entries.clear()
+            self._emails.clear()
+
+    def _broadcast(self, session_ids: Iterable[int]) -> None:
+        """Tell the other workers to drop these sessions (callable from any thread)"""
+        if self.redis is None or self._loop is None or self._loop.is_closed():
+            return
+        payload = json.dumps({"worker": self.worker_id, "sessions": sorted(session_ids)})
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            task = self._loop.create_task(self._publish(payload))
+            self._publishes.add(task)
+            task.add_done_callback(self._publishes.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(self._publish(payload), self._loop)
+
+    async def _publish(self, payload: str) -> None:
+        try:
+            await self.redis.publish(INVALIDATION_CHANNEL, payload)
+        except Exception as e:
+            logger.warning(f"Session cache invalidation publish failed: {e}")
+
+    async def _listen(self) -> None:
+        # Set after a connection failure, until the channel is subscribed again
+        disconnected = False
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                if disconnected:
+                    # Invalidations may have been missed while disconnected
+                    self.clear()
+                    disconnected = False
+                while True:
+                    # An explicit read timeout returns None instead of raising
+                    # the client's socket timeout on a quiet channel
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is None:
+                        continue
+                    data = json.loads(message["data"])
+                    if data["worker"] != self.worker_id:
+                        self.invalidate(data["sessions"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Session cache invalidation listener failed, retrying: {e}")
+                if not disconnected:
+                    # Other workers' changes can no longer reach this cache
+                    self.clear()
+                    disconnected = True
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    async def start(self) -> None:
+        """Bind to the running loop and start the invalidation listener"""
+        self._loop = asyncio.get_running_loop()
+        if self.redis is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+
+def build_session_cache() -> HotSessionCache:
+    """Create the session cache; cross-worker invalidation needs CACHE_BACKEND=redis"""
+    if settings.CACHE_BACKEND == "redis":
+        from app.clients.cache.redis_client import get_redis_client
+
+        return HotSessionCache(redis_client=get_redis_client())
+    return HotSessionCache()
@@ -0,0 +1,169 @@
+import hashlib
+import re
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+from app.cache.backends import CacheBackend, build_cache_backend
+from app.core.config import settings
+from app.entities.schema.agent_response_schema import SQLQueryResponse
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """Lower-case, strip accents and punctuation, collapse whitespace"""
+    text = unicodedata.normalize("NFKD", question)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = _NON_WORD.sub(" ", text.lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def prompt_version(prompt: str) -> str:
+    """Short stable fingerprint of a prompt text"""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+class SimilarityMatcher(ABC):
+    """Decides whether two normalized questions may share the same SQL"""
+
+    @abstractmethod
+    def matches(self, question: str, candidate: str) -> bool:
+        ...
+
+
+class ExactMatcher(SimilarityMatcher):
+    def matches(self, question: str, candidate: str) -> bool:
+        return question == candidate
+
+
+# Words that can be added or dropped without changing which SQL answers a
+# question. Anything else (comparisons like maior/menor, months and periods,
+# negations like nao/sem/com, store or product names) must match exactly.
+FILLER_WORDS = frozenset(
+    {
+        "a", "o", "as", "os", "um", "uma", "uns", "umas",
+        "de", "do", "da", "dos", "das",
+        "me", "mostre", "mostra", "mostrar", "liste", "listar", "informe",
+        "quero", "queria", "gostaria", "saber", "ver", "favor", "pf", "pfv",
+        "qual", "quais", "ola", "oi",
+        "the", "please", "show", "list", "what", "is", "are",
+    }
+)
+
+
+class TokenSetMatcher(SimilarityMatcher):
+    """Jaccard similarity over word sets, tolerating only filler-word edits.
+
+    "quais as 10 lojas com maior receita em 2024" may match the same
+    question without "as", but never one with "menor", "sem" or "2023"
+    instead: every word present in only one question must be in FILLER_WORDS.
+    """
+
+    def __init__(self, threshold: float = 0.85):
+        self.threshold = threshold
+
+    def matches(self, question: str, candidate: str) -> bool:
+        a, b = set(question.split()), set(candidate.split())
+        if not a or not b:
+            return False
+        if not (a ^ b) <= FILLER_WORDS:
+            return False
+        return len(a & b) / len(a | b) >= self.threshold
+
+
+def build_matcher(name: str) -> SimilarityMatcher:
+    if name == "token_set":
+        return TokenSetMatcher(settings.SQL_CACHE_SIMILARITY_THRESHOLD)
+    return ExactMatcher()
+
+
+class SQLQueryCache:
+    """Cache from normalized user question to the validated SQLQueryResponse.
+
+    Keys embed the prompt version, so changing the SQL generator prompt
+    invalidates every entry. Near-duplicate lookups scan a bounded
+    in-process index of recently cached questions with the matcher.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        matcher: SimilarityMatcher = None,
+        ttl: float = None,
+        index_size: int = 1024,
+    ):
+        self.backend = backend
+        self.matcher = matcher or ExactMatcher()
+        self.ttl = settings.SQL_CACHE_TTL if ttl is None else ttl
+        self.index_size = index_size
+        self._version = None
+        self._index: "OrderedDict[str, None]" = OrderedDict()
+
+    def _key(self, version: str, normalized: str) -> str:
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"{version}:{digest}"
+
+    def _check_version(self, version: str) -> None:
+        if version != self._version:
+            if self._version is not None:
+                logger.info(
+                    f"Prompt version changed ({self._version} -> {version}), dropping SQL cache index"
+                )
+            self._version = version
+            self._index.clear()
+
+    def _find_similar(self, normalized: str) -> Optional[str]:
+        if isinstance(self.matcher, ExactMatcher):
+            return None
+        for candidate in reversed(self._index):
+            if self.matcher.matches(normalized, candidate):
+                return candidate
+        return None
+
+    async def get(self, question: str, version: str) -> Optional[SQLQueryResponse]:
+        self._check_version(version)
+        normalized = normalize_question(question)
+        payload = await self.backend.get(self._key(version, normalized))
+        if payload is None:
+            similar = self._find_similar(normalized)
+            if similar is None:
+                return None
+            payload = await self.backend.get(self._key(version, similar))
+            if payload is None:
+                self._index.pop(similar, None)
+                return None
+            logger.info(f"SQL cache near-duplicate hit: '{normalized}' ~ '{similar}'")
+        try:
+            return SQLQueryResponse.model_validate_json(payload)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached SQL: {str(e)}")
+            return None
+
+    async def set(self, question: str, version: str, response: SQLQueryResponse) -> None:
+        self._check_version(version)
+        normalized = normalize_question(question)
+        if not normalized:
+            return
+        await self.backend.set(
+            self._key(version, normalized),
+            response.model_dump_json().encode("utf-8"),
+            self.ttl,
+        )
+        self._index[normalized] = None
+        self._index.move_to_end(normalized)
+        while len(self._index) > self.index_size:
+            self._index.popitem(last=False)
+
+
+def build_sql_query_cache() -> SQLQueryCache:
+    backend = build_cache_backend("sql-queries", max_entries=settings.SQL_CACHE_MAX_ENTRIES)
+    return SQLQueryCache(
+        backend,
+        matcher=build_matcher(settings.SQL_CACHE_MATCHER),
+        index_size=settings.SQL_CACHE_MAX_ENTRIES,
+    )
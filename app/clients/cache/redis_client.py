@@ -0,0 +1,26 @@
+from typing import Optional
+import redis.asyncio as redis
+from app.core.config import settings
+
+# Process-wide Redis connection pool shared by caches and stores
+_redis_client: Optional[redis.Redis] = None
+
+
+def get_redis_client() -> redis.Redis:
+    """Return the shared async Redis client, creating it on first use"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return _redis_client
+
+
+async def close_redis_client() -> None:
+    """Close the shared Redis client if it was ever created"""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+    _redis_client = None
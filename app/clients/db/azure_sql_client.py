@@ -1,19 +1,79 @@
+import asyncio
+import threading
 import pyodbc
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from contextlib import closing
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from app.core.config import settings
+from app.clients.db.azure_sql_pool import AzureSQLConnectionPool
+from app.clients.db.query_result import (
+    ColumnarResult,
+    ResultAggregator,
+    unique_column_names,
+)
 from app.monitoring.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-class AzureSQLClient:
+class QueryControl:
+    """Tracks the cursor of a running query so another thread can cancel it"""
+
     def __init__(self):
+        self.cancelled = False
+        self._cursor = None
+        self._lock = threading.Lock()
+
+    def attach(self, cursor) -> None:
+        with self._lock:
+            if self.cancelled:
+                raise RuntimeError("Query cancelled before execution")
+            self._cursor = cursor
+
+    def detach(self) -> None:
+        with self._lock:
+            self._cursor = None
+
+    def cancel(self) -> None:
+        """Ask the server to abort the running statement and skip the remaining ones"""
+        with self._lock:
+            self.cancelled = True
+            cursor = self._cursor
+        if cursor is not None:
+            try:
+                cursor.cancel()
+            except Exception as e:
+                logger.warning(f"Failed to cancel running query: {str(e)}")
+
+
+class AzureSQLClient:
+    def __init__(self, isolate_statements: bool = None):
         self.server = settings.AZURE_DB_HOST
         self.database = settings.AZURE_DATABASE
         self.username = settings.AZURE_DB_USER
         self.password = settings.AZURE_DB_PASSWORD
         self.connection_string = None
         self._setup_connection_string()
+        # Open a dedicated connection per statement instead of reusing pooled ones
+        self.isolate_statements = (
+            settings.AZURE_SQL_ISOLATE_STATEMENTS
+            if isolate_statements is None
+            else isolate_statements
+        )
+        self.pool = AzureSQLConnectionPool(
+            self.connection_string,
+            max_size=settings.AZURE_SQL_POOL_SIZE,
+            max_lifetime=settings.AZURE_SQL_POOL_MAX_LIFETIME,
+            checkout_timeout=settings.AZURE_SQL_POOL_TIMEOUT,
+            health_check_interval=settings.AZURE_SQL_POOL_HEALTH_CHECK_INTERVAL,
+        )
+        self.fetch_batch_size = settings.AZURE_SQL_FETCH_BATCH_SIZE
+        # Dedicated bounded pool so blocking pyodbc calls never run on the event loop
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.AZURE_SQL_QUERY_WORKERS,
+            thread_name_prefix="azure-sql",
+        )
 
     def _setup_connection_string(self):
         """Setup connection string for Azure SQL with SQL authentication"""
@@ -28,16 +88,110 @@ class AzureSQLClient:
             f"Connection Timeout=30;"
         )
 
-    def execute_query(self, query: str) -> Dict[str, Any]:
-        """Execute a SQL query and return results"""
-        conn = None
+    def _fetch_batches(
+        self,
+        conn: pyodbc.Connection,
+        stmt: str,
+        control: Optional[QueryControl] = None,
+    ) -> Iterator[Tuple[List[str], List[Any]]]:
+        """Execute one statement on conn, yielding (columns, rows) per fetchmany batch"""
+        cursor = conn.cursor()
+        if control:
+            control.attach(cursor)
+        try:
+            cursor.execute(stmt)
+
+            # Statements without a result set (e.g. DECLARE) have no description
+            if cursor.description:
+                # Unaliased expressions all come back as "", keep them apart
+                columns = unique_column_names([column[0] for column in cursor.description])
+                while True:
+                    rows = cursor.fetchmany(self.fetch_batch_size)
+                    if not rows:
+                        break
+                    yield columns, rows
+        finally:
+            if control:
+                control.detach()
+            cursor.close()
+
+    def _iter_batches(
+        self,
+        statements: List[str],
+        timeout: Optional[int] = None,
+        control: Optional[QueryControl] = None,
+    ) -> Iterator[Tuple[List[str], List[Any]]]:
+        """Row batches of every statement; closing the iterator releases the connection"""
+        if self.isolate_statements:
+            # Execute each statement with its own short-lived connection
+            for stmt in statements:
+                conn = pyodbc.connect(self.connection_string, autocommit=True)
+                try:
+                    conn.timeout = timeout or 0
+                    yield from self._fetch_batches(conn, stmt, control)
+                finally:
+                    conn.close()
+        else:
+            with self.pool.connection() as pooled_conn:
+                pooled_conn.timeout = timeout or 0
+                try:
+                    for stmt in statements:
+                        yield from self._fetch_batches(pooled_conn, stmt, control)
+                finally:
+                    pooled_conn.timeout = 0
+
+    def _split_statements(self, query: str) -> List[str]:
+        """Remove comment lines and split the query into statements"""
+        lines = query.split('\n')
+        clean_lines = [line for line in lines if not line.strip().startswith('--')]
+        query_clean = '\n'.join(clean_lines).strip()
+        # Split by semicolon for multiple statements
+        return [s.strip() for s in query_clean.split(';') if s.strip()]
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool usage and exhaustion metrics"""
+        return self.pool.stats()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pool.close()
+
+    def iter_query(
+        self, query: str, timeout: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream result rows as dicts, fetching fetch_batch_size rows at a time.
+
+        Stopping early (break / close()) closes the cursor and returns the
+        connection to the pool without fetching the remaining rows.
+        """
+        batches = self._iter_batches(self._split_statements(query), timeout)
+        with closing(batches):
+            for columns, rows in batches:
+                for row in rows:
+                    yield dict(zip(columns, row))
+
+    def execute_query(
+        self,
+        query: str,
+        timeout: Optional[int] = None,
+        control: Optional[QueryControl] = None,
+        sample_size: Optional[int] = None,
+        count_rows: bool = True,
+    ) -> Dict[str, Any]:
+        """Execute a SQL query and return results.
+
+        timeout is enforced server-side per statement (seconds, 0 = no limit);
+        control allows the query to be cancelled from another thread.
+        Only the first sample_size rows are kept in "data", a ColumnarResult
+        (all rows when None); the remaining rows are counted batch by batch
+        for "row_count", or not fetched at all when count_rows is False.
+        When every row was fetched, "aggregates" holds per-column aggregates
+        over all of them (see ColumnStats.summary).
+        """
         try:
-            # Remove comments and validate
-            lines = query.split('\n')
-            clean_lines = [line for line in lines if not line.strip().startswith('--')]
-            query_clean = '\n'.join(clean_lines).strip()
+            statements = self._split_statements(query)
 
-            if not query_clean:
+            if not statements:
                 logger.warning(f"Invalid query (comment or empty): {query}")
                 return {
                     "success": False,
@@ -45,55 +199,53 @@ class AzureSQLClient:
                     "data": []
                 }
 
-            logger.info(f"Executing query: {query_clean}")
-
-            # Split by semicolon for multiple statements
-            statements = [s.strip() for s in query_clean.split(';') if s.strip()]
-
-            all_results = []
-            all_columns = []
-
-            # Execute each statement separately with its own connection to avoid memory corruption
-            for stmt in statements:
-                conn = pyodbc.connect(self.connection_string, autocommit=True)
-                cursor = conn.cursor()
-
-                cursor.execute(stmt)
+            logger.info(f"Executing query: {';'.join(statements)}")
 
-                # Get column names
-                if cursor.description:
-                    columns = [column[0] for column in cursor.description]
-                    if not all_columns:
-                        all_columns = columns
+            sample = ColumnarResult([])
+            aggregator = ResultAggregator()
+            row_count = 0
+            complete = True
 
-                    # Fetch rows and convert to dicts
-                    rows = cursor.fetchall()
-                    for row in rows:
-                        all_results.append(dict(zip(columns, row)))
+            batches = self._iter_batches(statements, timeout, control)
+            with closing(batches):
+                for columns, rows in batches:
+                    if not sample.columns:
+                        sample.append_rows(columns, [])
+                    row_count += len(rows)
+                    room = len(rows) if sample_size is None else sample_size - len(sample)
+                    if room > 0:
+                        sample.append_rows(columns, rows[:room])
+                    if not count_rows and sample_size is not None and len(sample) >= sample_size:
+                        # Enough rows for the consumer, stop fetching
+                        complete = False
+                        break
+                    aggregator.add_rows(columns, rows)
 
-                cursor.close()
-                conn.close()
-                conn = None
-
-            return {
+            sample.compact()
+            result = {
                 "success": True,
-                "data": all_results,
-                "row_count": len(all_results),
-                "columns": all_columns,
+                "data": sample,
+                "row_count": row_count,
+                "columns": sample.columns,
+                "truncated": len(sample) < row_count,
             }
+            if complete:
+                result["aggregates"] = aggregator.summary(settings.RESULT_SUMMARY_TOP_K)
+            return result
 
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Query execution failed: {error_msg}")
             return {"success": False, "error": error_msg, "data": []}
-        finally:
-            if conn:
-                try:
-                    conn.close()
-                except:
-                    pass
 
-    def execute_query_safe(self, query: str, max_rows: int = 1000) -> Dict[str, Any]:
+    def execute_query_safe(
+        self,
+        query: str,
+        max_rows: int = 1000,
+        timeout: Optional[int] = None,
+        control: Optional[QueryControl] = None,
+        sample_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """Execute query with safety limits"""
         try:
             # Add LIMIT if not present and query is a SELECT
@@ -105,8 +257,51 @@ class AzureSQLClient:
                     # Add TOP clause for SQL Server
                     query = query.replace("SELECT", f"SELECT TOP {max_rows}", 1)
 
-            return self.execute_query(query)
+            return self.execute_query(
+                query, timeout=timeout, control=control, sample_size=sample_size
+            )
 
         except Exception as e:
             logger.error(f"Safe query execution failed: {str(e)}")
             return {"success": False, "error": str(e), "data": []}
+
+    async def execute_query_safe_async(
+        self,
+        query: str,
+        max_rows: int = 1000,
+        timeout: Optional[int] = None,
+        sample_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Run execute_query_safe on the query thread pool without blocking the event loop.
+
+        The query is cancelled on the server when it exceeds timeout seconds or
+        when the awaiting task is cancelled (e.g. the HTTP client disconnected).
+        """
+        timeout = timeout or settings.AZURE_SQL_QUERY_TIMEOUT
+        control = QueryControl()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self.executor,
+            partial(
+                self.execute_query_safe,
+                query,
+                max_rows,
+                timeout=timeout,
+                control=control,
+                sample_size=sample_size,
+            ),
+        )
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            control.cancel()
+            logger.error(f"Query timed out after {timeout}s")
+            return {
+                "success": False,
+                "error": f"Query timed out after {timeout} seconds",
+                "data": [],
+            }
+        except asyncio.CancelledError:
+            control.cancel()
+            logger.info("Query cancelled by caller")
+            raise
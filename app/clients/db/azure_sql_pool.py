@@ -0,0 +1,212 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator
+import pyodbc
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+# SQLSTATEs after which a connection is not reused: connection failures
+# (class 08), timeouts and cancellations, which can leave a batch running
+DISCARD_SQLSTATES = ("08", "HYT00", "HYT01", "HY008")
+
+
+class PoolExhaustedError(Exception):
+    """Raised when no connection becomes available within the checkout timeout"""
+
+
+class PooledConnection:
+    def __init__(self, conn: pyodbc.Connection):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+    def idle_time(self) -> float:
+        return time.monotonic() - self.last_used_at
+
+    def close(self) -> None:
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+
+class AzureSQLConnectionPool:
+    """Bounded, thread-safe pool of pyodbc connections to Azure SQL.
+
+    Connections are recycled once they exceed ``max_lifetime`` seconds and are
+    pinged with ``SELECT 1`` before reuse when they have been idle longer than
+    ``health_check_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        max_size: int = 10,
+        max_lifetime: float = 1800,
+        checkout_timeout: float = 30,
+        health_check_interval: float = 30,
+    ):
+        self.connection_string = connection_string
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle: Deque[PooledConnection] = deque()
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._metrics = {
+            "created": 0,
+            "checkouts": 0,
+            "recycled": 0,
+            "health_check_failures": 0,
+            "discarded": 0,
+            "exhausted_waits": 0,
+            "exhausted_timeouts": 0,
+            "wait_seconds_total": 0.0,
+        }
+
+    def _connect(self) -> PooledConnection:
+        conn = pyodbc.connect(self.connection_string, autocommit=True)
+        with self._cond:
+            self._metrics["created"] += 1
+        return PooledConnection(conn)
+
+    def _is_healthy(self, pooled: PooledConnection) -> bool:
+        if pooled.idle_time() < self.health_check_interval:
+            return True
+        return self._ping(pooled)
+
+    def _ping(self, pooled: PooledConnection) -> bool:
+        try:
+            cursor = pooled.conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled connection failed health check: {str(e)}")
+            with self._cond:
+                self._metrics["health_check_failures"] += 1
+            return False
+
+    def _drop(self, pooled: PooledConnection, metric: str) -> None:
+        pooled.close()
+        with self._cond:
+            self._size -= 1
+            self._metrics[metric] += 1
+            self._cond.notify()
+
+    def acquire(self) -> PooledConnection:
+        """Check out a connection, creating one if the pool is below max_size"""
+        deadline = time.monotonic() + self.checkout_timeout
+        waited = False
+        while True:
+            pooled = None
+            create = False
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Azure SQL connection pool is closed")
+                if self._idle:
+                    pooled = self._idle.pop()
+                elif self._size < self.max_size:
+                    self._size += 1
+                    create = True
+                else:
+                    if not waited:
+                        waited = True
+                        self._metrics["exhausted_waits"] += 1
+                        logger.warning(
+                            f"Azure SQL pool exhausted ({self._size}/{self.max_size} in use), waiting"
+                        )
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._metrics["exhausted_timeouts"] += 1
+                        raise PoolExhaustedError(
+                            f"No Azure SQL connection available after {self.checkout_timeout}s"
+                        )
+                    started = time.monotonic()
+                    self._cond.wait(remaining)
+                    self._metrics["wait_seconds_total"] += time.monotonic() - started
+                    continue
+
+            if create:
+                try:
+                    pooled = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            elif pooled.age() >= self.max_lifetime:
+                self._drop(pooled, "recycled")
+                continue
+            elif not self._is_healthy(pooled):
+                self._drop(pooled, "discarded")
+                continue
+
+            with self._cond:
+                self._metrics["checkouts"] += 1
+            return pooled
+
+    def release(self, pooled: PooledConnection, discard: bool = False) -> None:
+        """Return a connection to the pool, or close it when discard is set"""
+        if discard or self._closed or pooled.age() >= self.max_lifetime:
+            self._drop(pooled, "discarded" if discard else "recycled")
+            return
+        pooled.last_used_at = time.monotonic()
+        with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    def _is_broken(self, pooled: PooledConnection, error: pyodbc.Error) -> bool:
+        """Whether a connection that raised error must be discarded"""
+        sqlstate = error.args[0] if error.args and isinstance(error.args[0], str) else ""
+        if sqlstate.startswith(DISCARD_SQLSTATES):
+            return True
+        # Statement-level errors (syntax, permissions, constraints) leave the
+        # connection usable; anything unclassified is confirmed with a ping
+        if sqlstate[:2] in ("23", "42"):
+            return False
+        return not self._ping(pooled)
+
+    @contextmanager
+    def connection(self) -> Iterator[pyodbc.Connection]:
+        """Context manager yielding a pooled connection; broken connections are discarded"""
+        pooled = self.acquire()
+        discard = False
+        try:
+            yield pooled.conn
+        except pyodbc.Error as e:
+            discard = self._is_broken(pooled, e)
+            raise
+        finally:
+            self.release(pooled, discard=discard)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                **self._metrics,
+            }
+
+    def close(self) -> None:
+        """Close idle connections and refuse further checkouts"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            pooled.close()
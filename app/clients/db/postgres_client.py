@@ -1,7 +1,8 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from typing import Any
+from typing import AsyncIterator
 from app.core.config import settings
 from app.monitoring.logging import get_logger
 
@@ -34,3 +35,29 @@ def get_db():
         db.close()
 
 
+# Async engine (asyncpg) for code running on the event loop
+try:
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=10,
+        pool_timeout=30,
+        connect_args={"timeout": 5}
+    )
+except Exception as e:
+    logger.error(f"Failed to create async database engine: {str(e)}")
+    raise
+
+# expire_on_commit=False: attributes stay readable after commit without an implicit (awaitable) reload
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+#Dependency
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close the async connection pool (called on application shutdown)"""
+    await async_engine.dispose()
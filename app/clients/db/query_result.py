@@ -0,0 +1,342 @@
+import base64
+import uuid
+from array import array
+from collections import Counter
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+
+def value_kind(value: Any) -> str:
+    """Type name of a non-null result value"""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, Decimal):
+        return "decimal"
+    if isinstance(value, datetime):
+        return "datetime"
+    if isinstance(value, date):
+        return "date"
+    if isinstance(value, str):
+        return "str"
+    return "object"
+
+
+def combine_kinds(kinds: Set[str]) -> str:
+    """Common type name of a column given the kinds of its values"""
+    if not kinds:
+        return "null"
+    if len(kinds) == 1:
+        return next(iter(kinds))
+    if kinds <= {"int", "float", "decimal"}:
+        return "number"
+    return "mixed"
+
+
+def infer_dtype(values: Sequence[Any]) -> str:
+    """Name of the common Python type of the non-null values of a column"""
+    return combine_kinds({value_kind(value) for value in values if value is not None})
+
+
+NUMERIC_DTYPES = {"int", "float", "decimal", "number"}
+ORDERED_DTYPES = {"date", "datetime"}
+# Distinct values counted per column before counting stops taking new keys
+MAX_DISTINCT_VALUES = 10_000
+# Column types whose values JSON represents as is
+JSON_DTYPES = {"null", "bool", "int", "float", "str"}
+
+_DECODERS = {
+    "decimal": Decimal,
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "time": time.fromisoformat,
+    "uuid": uuid.UUID,
+    "bytes": base64.b64decode,
+}
+
+
+def encode_value(value: Any) -> Any:
+    """JSON-safe form of a result value; other types are tagged for decode_value"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Decimal):
+        return {"$type": "decimal", "value": str(value)}
+    if isinstance(value, datetime):
+        return {"$type": "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {"$type": "date", "value": value.isoformat()}
+    if isinstance(value, time):
+        return {"$type": "time", "value": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"$type": "uuid", "value": str(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {"$type": "bytes", "value": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"Cannot serialize result value of type {type(value).__name__}")
+
+
+def decode_value(value: Any) -> Any:
+    """Inverse of encode_value; untagged values are returned unchanged"""
+    if isinstance(value, dict) and "$type" in value:
+        return _DECODERS[value["$type"]](value["value"])
+    return value
+
+
+def unique_column_names(columns: Sequence[str]) -> List[str]:
+    """Column names made unique by position.
+
+    Drivers report "" for unaliased expressions and repeat names selected
+    twice (e.g. joins); those become col_<n> (1-based position) and
+    <name>_2, <name>_3... so every column keeps its own array.
+    """
+    names = []
+    seen = set(columns)
+    used = set()
+    for position, name in enumerate(columns, start=1):
+        if not name:
+            candidate, suffix = f"col_{position}", position
+        elif name in used:
+            candidate, suffix = f"{name}_2", 2
+        else:
+            candidate, suffix = name, None
+        base = name or "col"
+        while candidate in used or (candidate != name and candidate in seen):
+            suffix += 1
+            candidate = f"{base}_{suffix}"
+        used.add(candidate)
+        names.append(candidate)
+    return names
+
+
+class ColumnStats:
+    """Running aggregates of one column, fed batch by batch.
+
+    Tracks nulls, min/max/sum of numbers and dates and counts of other
+    values, so a result can be summarized without keeping its rows. At most
+    max_distinct values are counted; later new values are ignored and the
+    distinct count is reported as ">max_distinct".
+    """
+
+    __slots__ = (
+        "kinds", "nulls", "min", "max", "sum", "ordered", "counts", "max_distinct", "overflow"
+    )
+
+    def __init__(self, nulls: int = 0, max_distinct: int = MAX_DISTINCT_VALUES):
+        self.kinds: Set[str] = set()
+        self.nulls = nulls
+        self.min = None
+        self.max = None
+        self.sum = None
+        # False once values that cannot be compared were seen (e.g. date and datetime)
+        self.ordered = True
+        self.counts: Counter = Counter()
+        self.max_distinct = max_distinct
+        self.overflow = False
+
+    def add(self, values: Iterable[Any]) -> None:
+        for value in values:
+            if value is None:
+                self.nulls += 1
+                continue
+            kind = value_kind(value)
+            self.kinds.add(kind)
+            if kind in NUMERIC_DTYPES or kind in ORDERED_DTYPES:
+                if self.ordered:
+                    try:
+                        if self.min is None or value < self.min:
+                            self.min = value
+                        if self.max is None or value > self.max:
+                            self.max = value
+                    except TypeError:
+                        self.ordered = False
+                if kind in NUMERIC_DTYPES:
+                    if self.sum is None:
+                        self.sum = value
+                    else:
+                        try:
+                            self.sum += value
+                        except TypeError:
+                            # Decimal and float do not mix in arithmetic
+                            self.sum = float(self.sum) + float(value)
+            else:
+                try:
+                    if value in self.counts or len(self.counts) < self.max_distinct:
+                        self.counts[value] += 1
+                    else:
+                        self.overflow = True
+                except TypeError:
+                    # Unhashable values are not counted
+                    pass
+
+    def summary(self, top_k: int = 5) -> Dict[str, Any]:
+        dtype = combine_kinds(self.kinds)
+        column = {"type": dtype, "nulls": self.nulls}
+        if dtype in NUMERIC_DTYPES and self.kinds:
+            values = (self.min, self.max, self.sum)
+            if dtype == "number":
+                values = tuple(float(v) for v in values)
+            column.update(zip(("min", "max", "sum"), values))
+        elif dtype in ORDERED_DTYPES and self.kinds:
+            column.update(min=self.min, max=self.max)
+        elif self.counts:
+            distinct = f">{self.max_distinct}" if self.overflow else len(self.counts)
+            column.update(distinct=distinct, top=self.counts.most_common(top_k))
+        return column
+
+
+class ResultAggregator:
+    """Per-column aggregates over every row of a result, fed batch by batch"""
+
+    def __init__(self):
+        self.columns: Dict[str, ColumnStats] = {}
+        self.row_count = 0
+
+    def add_rows(self, columns: List[str], rows: Sequence[Sequence[Any]]) -> None:
+        """Add a batch; columns are matched by name like ColumnarResult.append_rows"""
+        columns = unique_column_names(columns)
+        for name in columns:
+            if name not in self.columns:
+                # Rows of earlier batches had no value for this column
+                self.columns[name] = ColumnStats(nulls=self.row_count)
+        for name, stats in self.columns.items():
+            if name not in columns:
+                stats.nulls += len(rows)
+        for name, values in zip(columns, zip(*rows)):
+            self.columns[name].add(values)
+        self.row_count += len(rows)
+
+    def summary(self, top_k: int = 5) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.summary(top_k) for name, stats in self.columns.items()}
+
+
+class ColumnarResult:
+    """Query rows stored column-wise: column names once plus one array per column.
+
+    Integer and float columns without nulls are packed into typed arrays;
+    other columns stay as lists of Python values.
+    """
+
+    __slots__ = ("columns", "arrays", "dtypes")
+
+    def __init__(
+        self,
+        columns: List[str],
+        arrays: List[Sequence[Any]] = None,
+        dtypes: List[str] = None,
+    ):
+        self.columns = unique_column_names(columns)
+        self.arrays = arrays if arrays is not None else [[] for _ in self.columns]
+        self.dtypes = dtypes if dtypes is not None else [infer_dtype(a) for a in self.arrays]
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "ColumnarResult":
+        result = cls([])
+        for record in records:
+            result.append_rows(list(record.keys()), [tuple(record.values())])
+        return result.compact()
+
+    def __len__(self) -> int:
+        return len(self.arrays[0]) if self.arrays else 0
+
+    def __repr__(self) -> str:
+        return f"ColumnarResult(columns={self.columns}, rows={len(self)})"
+
+    def append_rows(self, columns: List[str], rows: Iterable[Sequence[Any]]) -> None:
+        """Append rows of a result set; columns are matched by name.
+
+        Names are first made unique by position (see unique_column_names).
+        Columns not seen before are added and back-filled with None, missing
+        ones are padded with None (multi-statement batches may differ).
+        """
+        columns = unique_column_names(columns)
+        start = len(self)
+        for name in columns:
+            if name not in self.columns:
+                self.columns.append(name)
+                self.arrays.append([None] * start)
+        positions = [self.columns.index(name) for name in columns]
+        if positions == list(range(len(self.columns))):
+            # Same layout as this result: transpose directly
+            for row in rows:
+                for array_, value in zip(self.arrays, row):
+                    array_.append(value)
+        else:
+            missing = [i for i in range(len(self.columns)) if i not in positions]
+            for row in rows:
+                for position, value in zip(positions, row):
+                    self.arrays[position].append(value)
+                for position in missing:
+                    self.arrays[position].append(None)
+
+    def compact(self) -> "ColumnarResult":
+        """Infer column types and pack null-free int/float columns into typed arrays"""
+        self.dtypes = [infer_dtype(a) for a in self.arrays]
+        for i, (values, dtype) in enumerate(zip(self.arrays, self.dtypes)):
+            if isinstance(values, array) or None in values:
+                continue
+            if dtype == "int":
+                try:
+                    self.arrays[i] = array("q", values)
+                except OverflowError:
+                    pass
+            elif dtype == "float":
+                self.arrays[i] = array("d", values)
+        return self
+
+    def slice(self, start: int = 0, stop: Optional[int] = None) -> "ColumnarResult":
+        return ColumnarResult(
+            self.columns, [a[start:stop] for a in self.arrays], list(self.dtypes)
+        )
+
+    def head(self, n: int) -> "ColumnarResult":
+        return self.slice(0, n)
+
+    def column(self, name: str) -> Sequence[Any]:
+        return self.arrays[self.columns.index(name)]
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        return zip(*self.arrays) if self.arrays else iter(())
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Row dicts, for consumers that still expect the row-oriented shape"""
+        return [dict(zip(self.columns, row)) for row in self.rows()]
+
+    def summary(self, top_k: int = 5) -> Dict[str, Dict[str, Any]]:
+        """Per-column aggregates: nulls, min/max/sum for numbers and dates, top values otherwise"""
+        stats = {}
+        for name, values in zip(self.columns, self.arrays):
+            column = ColumnStats()
+            column.add(values)
+            stats[name] = column.summary(top_k)
+        return stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form; Decimal, date/time, UUID and bytes values are tagged"""
+        return {
+            "columns": self.columns,
+            "dtypes": self.dtypes,
+            "arrays": [
+                list(a) if dtype in JSON_DTYPES else [encode_value(v) for v in a]
+                for a, dtype in zip(self.arrays, self.dtypes)
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnarResult":
+        dtypes = data.get("dtypes") or [None] * len(data["columns"])
+        arrays = [
+            values if dtype in JSON_DTYPES else [decode_value(v) for v in values]
+            for values, dtype in zip(data["arrays"], dtypes)
+        ]
+        return cls(data["columns"], arrays).compact()
+
+    def to_pandas(self):
+        """Convert to a pandas DataFrame (pandas is imported lazily)"""
+        import pandas as pd
+
+        return pd.DataFrame(
+            {name: list(values) for name, values in zip(self.columns, self.arrays)}
+        )
@@ -1,6 +1,52 @@
-from typing import Dict, Any, List
-from openai import AzureOpenAI
+import asyncio
+from typing import AsyncIterator, Dict, Any, List, Optional
+import httpx
+from openai import AzureOpenAI, AsyncAzureOpenAI
 from app.core.config import settings
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+API_VERSION = "2024-02-15-preview"
+
+# Process-wide HTTP connection pool and concurrency limit shared by every
+# AzureOpenAIClient, so keep-alive connections are reused across requests.
+_async_http_client: Optional[httpx.AsyncClient] = None
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use"""
+    global _async_http_client
+    if _async_http_client is None or _async_http_client.is_closed:
+        _async_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.AZURE_OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.AZURE_OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.AZURE_OPENAI_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                settings.AZURE_OPENAI_TIMEOUT,
+                connect=settings.AZURE_OPENAI_CONNECT_TIMEOUT,
+            ),
+        )
+    return _async_http_client
+
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent in-flight LLM calls"""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(settings.AZURE_OPENAI_MAX_CONCURRENCY)
+    return _llm_semaphore
+
+
+async def close_async_http_client() -> None:
+    """Close the shared async HTTP client (called on application shutdown)"""
+    global _async_http_client
+    if _async_http_client is not None and not _async_http_client.is_closed:
+        await _async_http_client.aclose()
+    _async_http_client = None
 
 
 class AzureOpenAIClient:
@@ -15,8 +61,18 @@ class AzureOpenAIClient:
 
         self.client = AzureOpenAI(
             api_key=settings.AZURE_OPENAI_API_KEY,
-            api_version="2024-02-15-preview",
+            api_version=API_VERSION,
+            azure_endpoint=self.azure_endpoint,
+            timeout=settings.AZURE_OPENAI_TIMEOUT,
+            max_retries=settings.AZURE_OPENAI_MAX_RETRIES,
+        )
+        self.async_client = AsyncAzureOpenAI(
+            api_key=settings.AZURE_OPENAI_API_KEY,
+            api_version=API_VERSION,
             azure_endpoint=self.azure_endpoint,
+            timeout=settings.AZURE_OPENAI_TIMEOUT,
+            max_retries=settings.AZURE_OPENAI_MAX_RETRIES,
+            http_client=get_async_http_client(),
         )
 
     def test_connection(self) -> Dict[str, Any]:
@@ -37,18 +93,20 @@ class AzureOpenAIClient:
         except Exception as e:
             return {"success": False, "message": f"Connection failed: {str(e)}"}
 
+    def _build_params(self, messages: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        """Build the chat completion parameters with defaults"""
+        return {
+            "model": self.deployment_name,
+            "messages": messages,
+            "max_tokens": kwargs.get("max_tokens", 1000),
+            "temperature": kwargs.get("temperature", 0.7),
+            "top_p": kwargs.get("top_p", 1.0),
+        }
+
     def get_response(self, messages: List[Dict[str, Any]], **kwargs) -> str:
         """Generate a response using Azure OpenAI"""
         try:
-            # Default parameters
-            params = {
-                "model": self.deployment_name,
-                "messages": messages,
-                "max_tokens": kwargs.get("max_tokens", 1000),
-                "temperature": kwargs.get("temperature", 0.7),
-                "top_p": kwargs.get("top_p", 1.0),
-            }
-
+            params = self._build_params(messages, **kwargs)
             response = self.client.chat.completions.create(**params)
             return response.choices[0].message.content
 
@@ -56,5 +114,26 @@ class AzureOpenAIClient:
             return f"Error generating response: {str(e)}"
 
     async def get_response_async(self, messages: List[Dict[str, Any]], **kwargs) -> str:
-        """Async version of get_response for compatibility"""
-        return self.get_response(messages, **kwargs)
+        """Generate a response without blocking the event loop"""
+        try:
+            params = self._build_params(messages, **kwargs)
+            async with get_llm_semaphore():
+                response = await self.async_client.chat.completions.create(**params)
+            return response.choices[0].message.content
+
+        except Exception as e:
+            logger.error(f"Async completion failed: {str(e)}")
+            return f"Error generating response: {str(e)}"
+
+    async def stream_response_async(
+        self, messages: List[Dict[str, Any]], **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream the completion, yielding content deltas as they arrive"""
+        params = self._build_params(messages, **kwargs)
+        params["stream"] = True
+        async with get_llm_semaphore():
+            stream = await self.async_client.chat.completions.create(**params)
+            async for chunk in stream:
+                # Azure may send chunks without choices (e.g. content filter results)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
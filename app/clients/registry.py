@@ -0,0 +1,56 @@
+from fastapi import Request
+from app.clients.llm.azure_openai import AzureOpenAIClient, close_async_http_client
+from app.clients.db.azure_sql_client import AzureSQLClient
+from app.clients.cache.redis_client import close_redis_client
+from app.clients.db.postgres_client import dispose_async_engine
+from app.agents.history_manager import HistoryManager
+from app.agents.prompt_registry import PromptRegistry
+from app.entities.services.message_buffer import MessageWriteBuffer
+from app.cache.result_cache import build_result_cache
+from app.cache.sql_query_cache import build_sql_query_cache
+from app.cache.session_cache import build_session_cache
+from app.utils.single_flight import SingleFlight
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ClientRegistry:
+    """Application-scoped clients, built once at startup and shared by every request"""
+
+    def __init__(self):
+        self.llm_client = AzureOpenAIClient()
+        self.azure_sql_client = AzureSQLClient()
+        self.result_cache = build_result_cache()
+        self.sql_query_cache = build_sql_query_cache()
+        # Shares identical in-flight SQL generation and warehouse queries across requests
+        self.single_flight = SingleFlight()
+        self.history_manager = HistoryManager(self.llm_client)
+        # Active prompts from the prompts table, reloaded in the background
+        self.prompt_registry = PromptRegistry()
+        # Recently active sessions, kept current by the message buffer's flushes
+        self.session_cache = build_session_cache()
+        # Persists conversation turns in batches, off the request path
+        self.message_buffer = MessageWriteBuffer(on_persisted=self.session_cache.add_messages)
+
+    async def start(self) -> None:
+        """Load prompts and start background listeners (called on application startup)"""
+        await self.prompt_registry.start()
+        await self.session_cache.start()
+
+    async def close(self) -> None:
+        """Release pooled connections held by the registered clients"""
+        await self.history_manager.shutdown()
+        await self.message_buffer.close()
+        await self.session_cache.close()
+        await self.prompt_registry.close()
+        await dispose_async_engine()
+        await close_async_http_client()
+        self.azure_sql_client.close()
+        await close_redis_client()
+        logger.info("Client registry closed")
+
+
+# Dependency
+def get_clients(request: Request) -> ClientRegistry:
+    return request.app.state.clients
@@ -28,6 +28,15 @@ class Settings(BaseSettings):
     DATABASE_URL: str = (
         f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
     )
+    ASYNC_DATABASE_URL: str = (
+        f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+    )
+    # Chat messages are written behind the request, in batches
+    MESSAGE_BUFFER_MAX_SIZE: int = int(os.getenv("MESSAGE_BUFFER_MAX_SIZE", "100"))
+    MESSAGE_BUFFER_FLUSH_INTERVAL: float = float(os.getenv("MESSAGE_BUFFER_FLUSH_INTERVAL", "1"))
+    MESSAGE_BUFFER_MAX_PENDING: int = int(os.getenv("MESSAGE_BUFFER_MAX_PENDING", "10000"))
+    # Active prompts are reloaded from the prompts table every interval (seconds)
+    PROMPT_REFRESH_INTERVAL: float = float(os.getenv("PROMPT_REFRESH_INTERVAL", "30"))
 
     # Azure OpenAI
     AZURE_OPENAI_API_KEY: str = os.getenv("AZURE_OPENAI_API_KEY")
@@ -36,16 +45,70 @@ class Settings(BaseSettings):
     AZURE_RESOURCE_SECRET_KEY: str = os.getenv("AZURE_RESOURCE_SECRET_KEY")
     AZURE_CLIENT_ID: str = os.getenv("AZURE_CLIENT_ID")
     AZURE_TENANT_ID: str = os.getenv("AZURE_TENANT_ID")
+    AZURE_OPENAI_MAX_CONCURRENCY: int = int(os.getenv("AZURE_OPENAI_MAX_CONCURRENCY", "32"))
+    AZURE_OPENAI_MAX_CONNECTIONS: int = int(os.getenv("AZURE_OPENAI_MAX_CONNECTIONS", "64"))
+    AZURE_OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = int(
+        os.getenv("AZURE_OPENAI_MAX_KEEPALIVE_CONNECTIONS", "32")
+    )
+    AZURE_OPENAI_KEEPALIVE_EXPIRY: float = float(os.getenv("AZURE_OPENAI_KEEPALIVE_EXPIRY", "60"))
+    AZURE_OPENAI_TIMEOUT: float = float(os.getenv("AZURE_OPENAI_TIMEOUT", "60"))
+    AZURE_OPENAI_CONNECT_TIMEOUT: float = float(os.getenv("AZURE_OPENAI_CONNECT_TIMEOUT", "5"))
+    AZURE_OPENAI_MAX_RETRIES: int = int(os.getenv("AZURE_OPENAI_MAX_RETRIES", "2"))
+
+    # Prompt budgets (tokens are estimated at ~4 characters each)
+    RESULT_PROMPT_TOKEN_BUDGET: int = int(os.getenv("RESULT_PROMPT_TOKEN_BUDGET", "1500"))
+    RESULT_SUMMARY_TOP_K: int = int(os.getenv("RESULT_SUMMARY_TOP_K", "5"))
+    # Recent messages sent verbatim; older ones are folded into a rolling summary
+    HISTORY_MAX_MESSAGES: int = int(os.getenv("HISTORY_MAX_MESSAGES", "10"))
+    # Messages loaded per request; leaves room for turns not summarized yet
+    HISTORY_FETCH_MESSAGES: int = int(os.getenv("HISTORY_FETCH_MESSAGES", "20"))
+    HISTORY_TOKEN_BUDGET: int = int(os.getenv("HISTORY_TOKEN_BUDGET", "1500"))
+    HISTORY_SUMMARY_MAX_TOKENS: int = int(os.getenv("HISTORY_SUMMARY_MAX_TOKENS", "400"))
 
     # Azure SQL Database
     AZURE_DB_HOST: str = os.getenv("AZURE_DB_HOST")
     AZURE_DATABASE: str = os.getenv("AZURE_DATABASE")
     AZURE_DB_USER: str = os.getenv("AZURE_DB_USER")
     AZURE_DB_PASSWORD: str = os.getenv("AZURE_DB_PASSWORD")
+    AZURE_SQL_POOL_SIZE: int = int(os.getenv("AZURE_SQL_POOL_SIZE", "10"))
+    AZURE_SQL_POOL_MAX_LIFETIME: float = float(os.getenv("AZURE_SQL_POOL_MAX_LIFETIME", "1800"))
+    AZURE_SQL_POOL_TIMEOUT: float = float(os.getenv("AZURE_SQL_POOL_TIMEOUT", "30"))
+    AZURE_SQL_POOL_HEALTH_CHECK_INTERVAL: float = float(
+        os.getenv("AZURE_SQL_POOL_HEALTH_CHECK_INTERVAL", "30")
+    )
+    AZURE_SQL_ISOLATE_STATEMENTS: bool = (
+        os.getenv("AZURE_SQL_ISOLATE_STATEMENTS", "false").lower() == "true"
+    )
+    AZURE_SQL_QUERY_WORKERS: int = int(os.getenv("AZURE_SQL_QUERY_WORKERS", "8"))
+    AZURE_SQL_QUERY_TIMEOUT: int = int(os.getenv("AZURE_SQL_QUERY_TIMEOUT", "60"))
+    AZURE_SQL_FETCH_BATCH_SIZE: int = int(os.getenv("AZURE_SQL_FETCH_BATCH_SIZE", "500"))
+    # Rows kept in memory per query result; the rest are only counted
+    AZURE_SQL_SAMPLE_ROWS: int = int(os.getenv("AZURE_SQL_SAMPLE_ROWS", "100"))
+
+    # Redis / caching
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+    REDIS_SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")  # "memory" or "redis"
+    # Comma separated HH:MM times at which the warehouse tables are reloaded
+    WAREHOUSE_REFRESH_TIMES: str = os.getenv("WAREHOUSE_REFRESH_TIMES", "06:00")
+    RESULT_CACHE_MAX_TTL: float = float(os.getenv("RESULT_CACHE_MAX_TTL", "3600"))
+    RESULT_CACHE_MAX_ENTRIES: int = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "512"))
+    RESULT_CACHE_MAX_BYTES: int = int(os.getenv("RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    SQL_CACHE_TTL: float = float(os.getenv("SQL_CACHE_TTL", "86400"))
+    SQL_CACHE_MAX_ENTRIES: int = int(os.getenv("SQL_CACHE_MAX_ENTRIES", "2048"))
+    SQL_CACHE_MATCHER: str = os.getenv("SQL_CACHE_MATCHER", "exact")  # "exact" or "token_set"
+    SESSION_CACHE_MAX_ENTRIES: int = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "1000"))
+    SESSION_CACHE_TTL: float = float(os.getenv("SESSION_CACHE_TTL", "900"))
+    SQL_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv("SQL_CACHE_SIMILARITY_THRESHOLD", "0.85"))
 
     # Azure Bot Service
     MICROSOFT_APP_ID: str = os.getenv("MICROSOFT_APP_ID", "")
     MICROSOFT_APP_PASSWORD: str = os.getenv("MICROSOFT_APP_PASSWORD", "")
+    BOT_WORKERS: int = int(os.getenv("BOT_WORKERS", "16"))
+    BOT_MAX_PENDING_ACTIVITIES: int = int(os.getenv("BOT_MAX_PENDING_ACTIVITIES", "1000"))
+    # How long redelivered activities are recognised as duplicates
+    BOT_DEDUP_TTL: float = float(os.getenv("BOT_DEDUP_TTL", "600"))
 
 
 settings = Settings()
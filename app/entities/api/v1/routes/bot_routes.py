@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Request, Response, Depends
-from botbuilder.core import BotFrameworkAdapter, BotFrameworkAdapterSettings
-from botbuilder.schema import Activity
+from botbuilder.core import BotFrameworkAdapter, BotFrameworkAdapterSettings, TurnContext
+from botbuilder.schema import Activity, ActivityTypes
 from sqlalchemy.orm import Session
 from app.core.config import settings
-from app.clients.db.postgres_client import get_db
+from app.clients.db.postgres_client import SessionLocal, get_db
+from app.clients.registry import ClientRegistry, get_clients
+from app.bot.activity_queue import ConversationWorkQueue, get_bot_work_queue
+from app.bot.activity_dedup import ActivityDeduplicator, get_activity_deduplicator
 from app.bot.teams_bot import TeamsBot
 from app.monitoring.logging import get_logger
 
@@ -29,11 +32,47 @@ async def on_error(context, error):
 adapter.on_turn_error = on_error
 
 
+def build_message_job(
+    activity: Activity,
+    claims_identity,
+    clients: ClientRegistry,
+    deduplicator: ActivityDeduplicator,
+):
+    """Background job answering a message activity through its conversation reference"""
+    reference = TurnContext.get_conversation_reference(activity)
+
+    async def job():
+        db = SessionLocal()
+        try:
+            bot = TeamsBot(db, clients, deduplicator)
+
+            async def call_bot(turn_context: TurnContext):
+                # Run the bot on the original message; replies go to the stored reference
+                turn_context.activity = activity
+                await bot.on_turn(turn_context)
+
+            await adapter.continue_conversation(
+                reference, call_bot, claims_identity=claims_identity
+            )
+        finally:
+            db.close()
+
+    return job
+
+
 @bot_router.post("/messages")
-async def messages(request: Request, db: Session = Depends(get_db)):
+async def messages(
+    request: Request,
+    db: Session = Depends(get_db),
+    clients: ClientRegistry = Depends(get_clients),
+    work_queue: ConversationWorkQueue = Depends(get_bot_work_queue),
+    deduplicator: ActivityDeduplicator = Depends(get_activity_deduplicator),
+):
     """
     Main endpoint for Bot Framework to send activities.
     This is the webhook that Teams will call.
+    Message activities are authenticated, queued and acknowledged right away;
+    the answer is sent proactively once a background worker has computed it.
     """
     # Get the request body
     body = await request.json()
@@ -44,8 +83,21 @@ async def messages(request: Request, db: Session = Depends(get_db)):
     # Get authorization header
     auth_header = request.headers.get("Authorization", "")
 
-    # Create bot instance
-    bot = TeamsBot(db)
+    if activity.type == ActivityTypes.message:
+        try:
+            claims_identity = await adapter._authenticate_request(activity, auth_header)
+        except PermissionError as e:
+            logger.warning(f"Rejected unauthenticated activity: {e}")
+            return Response(status_code=401)
+
+        job = build_message_job(activity, claims_identity, clients, deduplicator)
+        if not work_queue.submit(activity.conversation.id, job):
+            logger.error("Bot work queue is full, rejecting activity")
+            return Response(status_code=503)
+        return Response(status_code=200)
+
+    # Other activity types (conversation updates, etc.) are cheap, handle inline
+    bot = TeamsBot(db, clients, deduplicator)
 
     # Process the activity
     async def call_bot(turn_context):
@@ -1,6 +1,11 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.clients.db.postgres_client import get_db
+from app.clients.registry import ClientRegistry, get_clients
 from app.entities.schema.answer_schema import AnswerSchema
 from app.entities.services.conversations_service import ConversationsService
 from app.monitoring.logging import get_logger
@@ -10,15 +15,89 @@ logger = get_logger(__name__)
 chatbot_router = APIRouter()
 
 
-def get_conversations_service(db: Session = Depends(get_db)) -> ConversationsService:
-    return ConversationsService(db)
+def get_conversations_service(
+    db: Session = Depends(get_db),
+    clients: ClientRegistry = Depends(get_clients),
+) -> ConversationsService:
+    return ConversationsService(db, clients)
+
+
+# Non-standard status (nginx) for requests the client abandoned
+CLIENT_CLOSED_REQUEST = 499
+
+
+class ClientDisconnected(Exception):
+    """The HTTP client went away before the work finished"""
+
+
+async def run_until_disconnected(
+    request: Request, awaitable: Awaitable[Any], poll_interval: float = 0.5
+) -> Any:
+    """Await the given work, cancelling it if the HTTP client disconnects first.
+
+    Raises ClientDisconnected once the work is cancelled.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                logger.info("Client disconnected, cancelling answer pipeline")
+                task.cancel()
+                # Let the cancellation unwind without re-raising the task's outcome
+                await asyncio.wait({task})
+                raise ClientDisconnected()
+    finally:
+        if not task.done():
+            task.cancel()
 
 
 @chatbot_router.post("/answer")
 async def answer(
     payload: AnswerSchema,
+    request: Request,
     conversations_service: ConversationsService = Depends(get_conversations_service),
 ):
     logger.info(f"Received message: {payload.message} for user: {payload.user_email}")
-    response = await conversations_service.answer(payload.message, payload.user_email)
+    try:
+        response = await run_until_disconnected(
+            request, conversations_service.answer(payload.message, payload.user_email)
+        )
+    except ClientDisconnected:
+        # Nobody reads this response; returning keeps the server from logging an error
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
     return {"response": response}
+
+
+def format_sse(event: dict) -> str:
+    """Encode an answer event as a Server-Sent Events message"""
+    return f"event: {event['event']}\ndata: {json.dumps(event, default=str, ensure_ascii=False)}\n\n"
+
+
+@chatbot_router.post("/answer/stream")
+async def answer_stream(
+    payload: AnswerSchema,
+    conversations_service: ConversationsService = Depends(get_conversations_service),
+):
+    """Stream progress events and response tokens as Server-Sent Events"""
+    logger.info(f"Received streaming message: {payload.message} for user: {payload.user_email}")
+
+    async def event_stream() -> AsyncIterator[str]:
+        # First byte goes out immediately, before any LLM or warehouse work
+        yield format_sse({"event": "status", "stage": "received"})
+        try:
+            async for event in conversations_service.answer_stream(
+                payload.message, payload.user_email
+            ):
+                yield format_sse(event)
+        except Exception as e:
+            logger.error(f"Streaming answer failed: {e}")
+            yield format_sse({"event": "error", "message": "Failed to generate response"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -5,6 +5,7 @@ from sqlalchemy import (
     DateTime,
     Integer,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -13,6 +14,10 @@ from app.clients.db.postgres_client import Base
 
 class ChatMessageModel(Base):
     __tablename__ = "chat_messages"
+    # Serves "latest messages of a session" lookups
+    __table_args__ = (
+        Index("ix_chat_messages_session_id_created_at", "session_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(
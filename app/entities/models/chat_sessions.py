@@ -14,7 +14,8 @@ class ChatSessionModel(Base):
     __tablename__ = "chat_sessions"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_email = Column(String(255), nullable=False)
+    # One session per user, enforced so concurrent first messages share it
+    user_email = Column(String(255), nullable=False, index=True, unique=True)
     meta_data = Column(JSON, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
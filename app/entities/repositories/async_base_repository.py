@@ -0,0 +1,199 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.entities.repositories.base_repository import (
+    CreateSchemaType,
+    ModelSchemaType,
+    ModelType,
+    RepositoryBase,
+    UpdateSchemaType,
+)
+from app.entities.schema.pagination_schema import PageSchema
+
+
+class AsyncBaseRepository(RepositoryBase[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Async counterpart of BaseRepository for use with an AsyncSession.
+
+    Offers the operations used on the request path with the same semantics
+    as their BaseRepository namesakes, without blocking the event loop.
+    """
+
+    async def get_by_id(self, db: AsyncSession, id: int) -> Optional[ModelSchemaType]:
+        """Get a record by ID.
+
+        Args:
+            db: Async database session
+            id: Record ID
+
+        Returns:
+            Model schema if found, None otherwise
+        """
+        db_obj = await db.get(self.model, id)
+        if not db_obj:
+            return None
+        return self.model_schema.model_validate(db_obj)
+
+    async def get_by_field(self, db: AsyncSession, **kwargs) -> Optional[ModelSchemaType]:
+        """Get the first record matching field values.
+
+        Args:
+            db: Async database session
+            **kwargs: Field names and values to filter by
+
+        Returns:
+            Model schema if found, None otherwise
+        """
+        stmt = select(self.model)
+        for field, value in kwargs.items():
+            stmt = stmt.where(getattr(self.model, field) == value)
+        db_obj = (await db.scalars(stmt.limit(1))).first()
+        if db_obj:
+            return self.model_schema.model_validate(db_obj)
+        return None
+
+    async def get_by_field_list(
+        self, db: AsyncSession, order_by: str = None, desc: bool = False, **kwargs
+    ) -> List[ModelSchemaType]:
+        """Get all records matching field values.
+
+        Args:
+            db: Async database session
+            order_by: Optional field name to order results by
+            desc: Whether to order in descending order (default: False)
+            **kwargs: Field names and values to filter by
+
+        Returns:
+            List of model schemas
+        """
+        stmt = select(self.model)
+        for field, value in kwargs.items():
+            stmt = stmt.where(getattr(self.model, field) == value)
+        if order_by:
+            order_field = getattr(self.model, order_by)
+            stmt = stmt.order_by(order_field.desc() if desc else order_field)
+        return [self.model_schema.model_validate(obj) for obj in await db.scalars(stmt)]
+
+    async def create(self, db: AsyncSession, obj_in: CreateSchemaType) -> ModelSchemaType:
+        """Create a new record.
+
+        Args:
+            db: Async database session
+            obj_in: Creation schema with new record data
+
+        Returns:
+            Created model schema
+        """
+        db_obj = self.model(**self._column_values(obj_in))
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return self.model_schema.model_validate(db_obj)
+
+    async def create_bulk(
+        self, db: AsyncSession, obj_list: List[CreateSchemaType]
+    ) -> List[ModelSchemaType]:
+        """Create multiple records with a single INSERT ... RETURNING.
+
+        Args:
+            db: Async database session
+            obj_list: List of creation schemas with new record data
+
+        Returns:
+            List of created model schemas, in the order of obj_list
+        """
+        if not obj_list:
+            return []
+        rows = [self._column_values(obj_in) for obj_in in obj_list]
+        result = (await db.execute(self._bulk_insert_statement(), rows)).all()
+        await db.commit()
+        return [self.model_schema.model_validate(row._mapping) for row in result]
+
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        id: int,
+        update_schema: Union[UpdateSchemaType, Dict[str, Any]],
+    ) -> Optional[ModelSchemaType]:
+        """Update an existing record.
+
+        Args:
+            db: Async database session
+            id: ID of the record to update
+            update_schema: Update schema or dict with new values
+
+        Returns:
+            Updated model schema or None if not found
+        """
+        db_obj = await db.get(self.model, id)
+        if not db_obj:
+            return None
+        if isinstance(update_schema, dict):
+            update_data = update_schema
+        else:
+            update_data = update_schema.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            if field in self.columns:
+                setattr(db_obj, field, value)
+        await db.commit()
+        await db.refresh(db_obj)
+        return self.model_schema.model_validate(db_obj)
+
+    async def remove_by_id(self, db: AsyncSession, *, id: int) -> Optional[ModelSchemaType]:
+        """Delete a record by ID.
+
+        Args:
+            db: Async database session
+            id: ID of record to delete
+
+        Returns:
+            Deleted model schema or None if not found
+        """
+        db_obj = await db.get(self.model, id)
+        if not db_obj:
+            return None
+        result_schema = self.model_schema.model_validate(db_obj)
+        await db.delete(db_obj)
+        await db.commit()
+        return result_schema
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        order_by: Sequence[str] = ("id",),
+        desc: bool = True,
+        **kwargs,
+    ) -> PageSchema[ModelSchemaType]:
+        """Get a page of records using keyset (cursor) pagination, see BaseRepository.get_page"""
+        order_by = self._keyset_order(order_by)
+        after = self._decode_cursor(cursor, order_by) if cursor else None
+        stmt = self._keyset_statement(order_by, desc, after, limit + 1, kwargs)
+        objs = (await db.scalars(stmt)).all()
+        return self._page(objs, order_by, limit)
+
+    async def iter_all(
+        self,
+        db: AsyncSession,
+        *,
+        batch_size: int = 1000,
+        order_by: Sequence[str] = ("id",),
+        desc: bool = False,
+        **kwargs,
+    ) -> AsyncIterator[ModelSchemaType]:
+        """Stream every matching record in keyset batches, see BaseRepository.iter_all"""
+        order_by = self._keyset_order(order_by)
+        after = None
+        while True:
+            stmt = self._keyset_statement(order_by, desc, after, batch_size, kwargs)
+            objs = (await db.scalars(stmt)).all()
+            for obj in objs:
+                yield self.model_schema.model_validate(obj)
+            if len(objs) < batch_size:
+                return
+            after = [getattr(objs[-1], field) for field in order_by]
+            for obj in objs:
+                db.expunge(obj)
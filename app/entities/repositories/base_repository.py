@@ -1,9 +1,30 @@
-from typing import Any, Dict, Generic, List, Type, TypeVar, Union
-from fastapi.encoders import jsonable_encoder
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from pydantic import BaseModel
+from sqlalchemy import Insert, Select, insert, inspect, literal, select, tuple_
 from sqlalchemy.orm import Session
 
 from app.clients.db.postgres_client import Base
+from app.entities.schema.pagination_schema import PageSchema
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -11,21 +32,91 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 ModelSchemaType = TypeVar("ModelSchemaType", bound=BaseModel)
 
 
-class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
-    """Base repository class providing common database operations.
+@lru_cache(maxsize=None)
+def model_columns(model: Type[Base]) -> FrozenSet[str]:
+    """Names of the column attributes of a model, computed once per model"""
+    return frozenset(attr.key for attr in inspect(model).column_attrs)
 
-    This class implements basic CRUD operations that can be inherited by specific repositories.
-    It uses SQLAlchemy for database operations and Pydantic for data validation.
 
-    Type Parameters:
-        ModelType: The SQLAlchemy model type
-        CreateSchemaType: The Pydantic schema type for creation
-        UpdateSchemaType: The Pydantic schema type for updates
+@lru_cache(maxsize=None)
+def schema_column_fields(schema: Type[BaseModel], model: Type[Base]) -> Tuple[str, ...]:
+    """Fields of a schema that map directly onto columns of a model"""
+    columns = model_columns(model)
+    return tuple(name for name in schema.model_fields if name in columns)
 
-    Attributes:
-        model: The SQLAlchemy model class
-        model_schema: The Pydantic schema class for the model
+
+# Python types of the columns usable as keyset sort keys (plus Enum subclasses)
+CURSOR_TYPES = (bool, int, float, str, Decimal, datetime, date)
+
+
+@lru_cache(maxsize=None)
+def column_python_type(model: Type[Base], field: str) -> Optional[type]:
+    """Python type of a column attribute, None when SQLAlchemy cannot tell"""
+    column = inspect(model).column_attrs[field].columns[0]
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def encode_cursor(order_by: Sequence[str], values: Sequence[Any]) -> str:
+    """Opaque cursor holding the sort key values of the last row of a page"""
+    encoded = []
+    for value in values:
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, Decimal):
+            value = str(value)
+        elif isinstance(value, date):
+            # Also covers datetime
+            value = value.isoformat()
+        encoded.append(value)
+    payload = json.dumps({"o": list(order_by), "v": encoded}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_key(value: Any, python_type: type) -> Any:
+    if value is None:
+        return None
+    if issubclass(python_type, Enum):
+        return python_type(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is float:
+        return float(value)
+    return value
+
+
+def decode_cursor(
+    cursor: str, order_by: Sequence[str], types: Sequence[type]
+) -> List[Any]:
+    """Sort key values from a cursor, restored to the given column types.
+
+    Raises ValueError if the cursor is invalid.
     """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["o"] != list(order_by) or len(payload["v"]) != len(types):
+            raise ValueError("Cursor was issued for a different ordering")
+        return [_decode_key(value, type_) for value, type_ in zip(payload["v"], types)]
+    except (
+        KeyError,
+        TypeError,
+        InvalidOperation,
+        json.JSONDecodeError,
+        UnicodeDecodeError,
+        binascii.Error,
+    ) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
+class RepositoryBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Model metadata and statement building shared by the sync and async repositories"""
 
     def __init__(self, model: Type[ModelType], model_schema: Type[ModelSchemaType]):
         """Initialize the repository with model and schema classes.
@@ -36,6 +127,101 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
         self.model_schema = model_schema
+        self.columns = model_columns(model)
+
+    def _column_values(
+        self, obj_in: Union[CreateSchemaType, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Map a schema or dict onto the model's columns.
+
+        Schema values are read as attributes, so enums, datetimes and JSON
+        values reach SQLAlchemy as-is instead of going through an encoder.
+        """
+        if isinstance(obj_in, dict):
+            return {k: v for k, v in obj_in.items() if k in self.columns}
+        return {
+            name: getattr(obj_in, name)
+            for name in schema_column_fields(type(obj_in), self.model)
+        }
+
+    def _keyset_order(self, order_by: Sequence[str]) -> Tuple[str, ...]:
+        """Validate the sort keys and append id as tie-breaker"""
+        for field in order_by:
+            if field not in self.columns:
+                raise ValueError(f"Cannot order {self.model.__name__} by {field}")
+            python_type = column_python_type(self.model, field)
+            if python_type is None or not (
+                issubclass(python_type, CURSOR_TYPES) or issubclass(python_type, Enum)
+            ):
+                raise ValueError(
+                    f"Cannot paginate {self.model.__name__} by {field}: "
+                    f"its values cannot be stored in a cursor"
+                )
+        return tuple(order_by) + (() if "id" in order_by else ("id",))
+
+    def _decode_cursor(self, cursor: str, order_by: Tuple[str, ...]) -> List[Any]:
+        types = [column_python_type(self.model, field) for field in order_by]
+        return decode_cursor(cursor, order_by, types)
+
+    def _keyset_statement(
+        self,
+        order_by: Tuple[str, ...],
+        desc: bool,
+        after: Optional[Sequence[Any]],
+        limit: int,
+        filters: Dict[str, Any],
+    ) -> Select:
+        """Select the rows strictly after the given sort key values, in sort order"""
+        keys = [getattr(self.model, field) for field in order_by]
+        stmt = select(self.model)
+        for field, value in filters.items():
+            stmt = stmt.where(getattr(self.model, field) == value)
+        if after is not None:
+            # Row-value comparison, served by an index on the sort keys
+            # Bind with the column types so enums and decimals are converted
+            position = tuple_(*keys)
+            last = tuple_(*(literal(value, key.type) for key, value in zip(keys, after)))
+            stmt = stmt.where(position < last if desc else position > last)
+        stmt = stmt.order_by(*[key.desc() if desc else key.asc() for key in keys])
+        return stmt.limit(limit)
+
+    def _bulk_insert_statement(self) -> Insert:
+        """INSERT returning every column, rows in parameter order"""
+        table = self.model.__table__
+        # Core insert: rows come back as plain tuples, no ORM objects to track
+        return insert(table).returning(*table.columns, sort_by_parameter_order=True)
+
+    def _page(
+        self, objs: Sequence[ModelType], order_by: Tuple[str, ...], limit: int
+    ) -> PageSchema[ModelSchemaType]:
+        """Build a page from up to limit + 1 rows; the extra row means more pages exist"""
+        next_cursor = None
+        if len(objs) > limit:
+            objs = objs[:limit]
+            next_cursor = encode_cursor(
+                order_by, [getattr(objs[-1], field) for field in order_by]
+            )
+        return PageSchema[self.model_schema](
+            items=[self.model_schema.model_validate(obj) for obj in objs],
+            next_cursor=next_cursor,
+        )
+
+
+class BaseRepository(RepositoryBase[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Base repository class providing common database operations.
+
+    This class implements basic CRUD operations that can be inherited by specific repositories.
+    It uses SQLAlchemy for database operations and Pydantic for data validation.
+
+    Type Parameters:
+        ModelType: The SQLAlchemy model type
+        CreateSchemaType: The Pydantic schema type for creation
+        UpdateSchemaType: The Pydantic schema type for updates
+
+    Attributes:
+        model: The SQLAlchemy model class
+        model_schema: The Pydantic schema class for the model
+    """
 
     def get_all(self, db: Session) -> List[ModelSchemaType]:
         """Get all records from the database.
@@ -56,6 +242,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> List[ModelSchemaType]:
         """Get paginated records from the database.
 
+        OFFSET pagination gets slower the deeper the page; prefer get_page
+        for large tables.
+
         Args:
             db: Database session
             offset: Number of records to skip
@@ -73,6 +262,93 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             .all()
         ]
 
+    def _keyset_query(
+        self,
+        db: Session,
+        order_by: Tuple[str, ...],
+        desc: bool,
+        after: Optional[Sequence[Any]],
+        limit: int,
+        filters: Dict[str, Any],
+    ) -> List[ModelType]:
+        """Rows strictly after the given sort key values, in sort order"""
+        return db.scalars(
+            self._keyset_statement(order_by, desc, after, limit, filters)
+        ).all()
+
+    def get_page(
+        self,
+        db: Session,
+        *,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        order_by: Sequence[str] = ("id",),
+        desc: bool = True,
+        **kwargs,
+    ) -> PageSchema[ModelSchemaType]:
+        """Get a page of records using keyset (cursor) pagination.
+
+        Unlike OFFSET, the cost of a page does not grow with its position.
+        Sort keys should be non-null and indexed; id is always appended as
+        a tie-breaker so the ordering is total.
+
+        Args:
+            db: Database session
+            limit: Maximum number of records to return
+            cursor: next_cursor of the previous page, None for the first page
+            order_by: Column names to sort by
+            desc: Whether to sort in descending order (default: True)
+            **kwargs: Field names and values to filter by
+
+        Returns:
+            Page schema with the records and the cursor of the next page
+
+        Raises:
+            ValueError: If a sort key is not a column or the cursor is invalid
+        """
+        order_by = self._keyset_order(order_by)
+        after = self._decode_cursor(cursor, order_by) if cursor else None
+        # One extra row tells whether another page exists
+        objs = self._keyset_query(db, order_by, desc, after, limit + 1, kwargs)
+        return self._page(objs, order_by, limit)
+
+    def iter_all(
+        self,
+        db: Session,
+        *,
+        batch_size: int = 1000,
+        order_by: Sequence[str] = ("id",),
+        desc: bool = False,
+        **kwargs,
+    ) -> Iterator[ModelSchemaType]:
+        """Stream every matching record in keyset-paginated batches.
+
+        Only one batch is held in memory at a time, which suits exports and
+        back-office jobs over large tables.
+
+        Args:
+            db: Database session
+            batch_size: Number of records fetched per query
+            order_by: Column names to sort by
+            desc: Whether to sort in descending order (default: False)
+            **kwargs: Field names and values to filter by
+
+        Yields:
+            Model schemas in sort order
+        """
+        order_by = self._keyset_order(order_by)
+        after = None
+        while True:
+            objs = self._keyset_query(db, order_by, desc, after, batch_size, kwargs)
+            for obj in objs:
+                yield self.model_schema.model_validate(obj)
+            if len(objs) < batch_size:
+                return
+            after = [getattr(objs[-1], field) for field in order_by]
+            # Detach the batch so the session does not accumulate every row
+            for obj in objs:
+                db.expunge(obj)
+
     def get_by_id(self, db: Session, id: int) -> ModelSchemaType:
         """Get a record by ID.
 
@@ -155,11 +431,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Created model schema
         """
-        obj_in_data = jsonable_encoder(obj_in)
-        relevant_keys = {
-            k: v for k, v in obj_in_data.items() if k in self.model.__table__.columns
-        }
-        db_obj = self.model(**relevant_keys)
+        db_obj = self.model(**self._column_values(obj_in))
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
@@ -170,32 +442,25 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> List[ModelSchemaType]:
         """Create multiple records in bulk.
 
+        Rows are sent as a single INSERT ... RETURNING (batched by the
+        dialect's insertmanyvalues support), so generated columns such as
+        IDs and server defaults come back without a refresh per row.
+
         Args:
             db: Database session
             obj_list: List of creation schemas with new record data
 
         Returns:
-            List of created model schemas
+            List of created model schemas, in the order of obj_list
         """
-        db_objs = []
-        for obj_in in obj_list:
-            obj_in_data = jsonable_encoder(obj_in)
-            relevant_keys = {
-                k: v
-                for k, v in obj_in_data.items()
-                if k in self.model.__table__.columns
-            }
-            db_obj = self.model(**relevant_keys)
-            db_objs.append(db_obj)
-
-        db.add_all(db_objs)
-        db.commit()
+        if not obj_list:
+            return []
 
-        # Refresh all objects to get their IDs
-        for db_obj in db_objs:
-            db.refresh(db_obj)
+        rows = [self._column_values(obj_in) for obj_in in obj_list]
+        result = db.execute(self._bulk_insert_statement(), rows).all()
+        db.commit()
 
-        return [self.model_schema.model_validate(obj) for obj in db_objs]
+        return [self.model_schema.model_validate(row._mapping) for row in result]
 
     def _update_obj(
         self,
@@ -213,14 +478,13 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Updated model
         """
-        obj_data = jsonable_encoder(db_obj)
         if isinstance(update_schema, dict):
             update_data = update_schema
         else:
             update_data = update_schema.model_dump(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        for field, value in update_data.items():
+            if field in self.columns:
+                setattr(db_obj, field, value)
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
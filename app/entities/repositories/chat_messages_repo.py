@@ -1,7 +1,10 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.entities.models.chat_messages import ChatMessageModel
 from app.entities.repositories.base_repository import BaseRepository
+from app.entities.repositories.async_base_repository import AsyncBaseRepository
 from app.entities.schema.chat_messages_schema import (
     ChatMessageCreateSchema,
     ChatMessageUpdateSchema,
@@ -16,13 +19,40 @@ class ChatMessageRepository(
         super().__init__(ChatMessageModel, ChatMessageSchema)
 
     def get_by_session_id(
-        self, db: Session, session_id: int
+        self, db: Session, session_id: int, after_id: Optional[int] = None
     ) -> List[ChatMessageSchema]:
-        """Get all messages for a specific session"""
+        """Get the messages for a specific session, optionally only those after after_id"""
+        query = db.query(self.model).filter(self.model.session_id == session_id)
+        if after_id:
+            query = query.filter(self.model.id > after_id)
         return [
             self.model_schema.model_validate(obj)
-            for obj in db.query(self.model)
-            .filter(self.model.session_id == session_id)
-            .order_by(self.model.created_at.asc())
-            .all()
+            # Messages written in one batch share created_at, id keeps their order
+            for obj in query.order_by(self.model.created_at.asc(), self.model.id.asc()).all()
         ]
+
+
+class AsyncChatMessageRepository(
+    AsyncBaseRepository[ChatMessageModel, ChatMessageCreateSchema, ChatMessageUpdateSchema]
+):
+    def __init__(self):
+        super().__init__(ChatMessageModel, ChatMessageSchema)
+
+    async def get_by_session_id(
+        self,
+        db: AsyncSession,
+        session_id: int,
+        after_id: Optional[int] = None,
+        up_to_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[ChatMessageSchema]:
+        """Get the oldest messages of a session, optionally within (after_id, up_to_id]"""
+        stmt = select(self.model).where(self.model.session_id == session_id)
+        if after_id:
+            stmt = stmt.where(self.model.id > after_id)
+        if up_to_id:
+            stmt = stmt.where(self.model.id <= up_to_id)
+        stmt = stmt.order_by(self.model.created_at.asc(), self.model.id.asc())
+        if limit:
+            stmt = stmt.limit(limit)
+        return [self.model_schema.model_validate(obj) for obj in await db.scalars(stmt)]
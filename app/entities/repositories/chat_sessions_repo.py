@@ -1,7 +1,13 @@
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy import Select, and_, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+from typing import List, Optional, Sequence, Tuple
 from app.entities.repositories.base_repository import BaseRepository
+from app.entities.repositories.async_base_repository import AsyncBaseRepository
 from app.entities.models.chat_sessions import ChatSessionModel
+from app.entities.models.chat_messages import ChatMessageModel
+from app.entities.schema.chat_messages_schema import ChatMessageSchema
 from app.entities.schema.chat_sessions_schema import (
     ChatSessionCreateSchema,
     ChatSessionUpdateSchema,
@@ -9,11 +15,60 @@ from app.entities.schema.chat_sessions_schema import (
 )
 
 
+def recent_messages_statement(user_email: str, limit: int) -> Select:
+    """A user's sessions, each outer-joined to its last `limit` messages.
+
+    Messages are ranked per session with a window function, so the session
+    and its latest messages come back in one round-trip.
+    """
+    ranked = (
+        select(
+            ChatMessageModel,
+            func.row_number()
+            .over(
+                partition_by=ChatMessageModel.session_id,
+                order_by=(ChatMessageModel.created_at.desc(), ChatMessageModel.id.desc()),
+            )
+            .label("position"),
+        )
+        .join(ChatSessionModel, ChatSessionModel.id == ChatMessageModel.session_id)
+        .where(ChatSessionModel.user_email == user_email)
+        .subquery()
+    )
+    message = aliased(ChatMessageModel, ranked)
+    return (
+        select(ChatSessionModel, message)
+        .outerjoin(
+            message,
+            and_(message.session_id == ChatSessionModel.id, ranked.c.position <= limit),
+        )
+        .where(ChatSessionModel.user_email == user_email)
+        .order_by(ChatSessionModel.id, message.created_at, message.id)
+    )
+
+
+def split_recent_messages(
+    rows: Sequence[Tuple[ChatSessionModel, Optional[ChatMessageModel]]],
+) -> Optional[Tuple[ChatSessionSchema, List[ChatMessageSchema]]]:
+    """Session schema and its messages (oldest first) from recent_messages_statement rows"""
+    if not rows:
+        return None
+    # user_email is unique, so every row belongs to the same session
+    session = rows[0][0]
+    messages = [
+        ChatMessageSchema.model_validate(obj)
+        for row_session, obj in rows
+        if row_session is session and obj is not None
+    ]
+    return ChatSessionSchema.model_validate(session), messages
+
+
 class ChatSessionsRepository(
     BaseRepository[ChatSessionModel, ChatSessionCreateSchema, ChatSessionUpdateSchema]
 ):
     def __init__(self):
         super().__init__(ChatSessionModel, ChatSessionSchema)
+
     def get_by_user_email(
         self, db: Session, user_email: str
     ) -> Optional[ChatSessionSchema]:
@@ -24,3 +79,41 @@ class ChatSessionsRepository(
         if not db_obj:
             return None
         return self.model_schema.model_validate(db_obj)
+
+    def get_with_recent_messages(
+        self, db: Session, user_email: str, limit: int
+    ) -> Optional[Tuple[ChatSessionSchema, List[ChatMessageSchema]]]:
+        """Get a user's chat session and its last `limit` messages in one round-trip"""
+        rows = db.execute(recent_messages_statement(user_email, limit)).all()
+        return split_recent_messages(rows)
+
+
+class AsyncChatSessionsRepository(
+    AsyncBaseRepository[ChatSessionModel, ChatSessionCreateSchema, ChatSessionUpdateSchema]
+):
+    def __init__(self):
+        super().__init__(ChatSessionModel, ChatSessionSchema)
+
+    async def get_with_recent_messages(
+        self, db: AsyncSession, user_email: str, limit: int
+    ) -> Optional[Tuple[ChatSessionSchema, List[ChatMessageSchema]]]:
+        """Get a user's chat session and its last `limit` messages in one round-trip"""
+        rows = (await db.execute(recent_messages_statement(user_email, limit))).all()
+        return split_recent_messages(rows)
+
+    async def create_if_missing(
+        self, db: AsyncSession, create_schema: ChatSessionCreateSchema
+    ) -> None:
+        """Insert the user's session unless one already exists.
+
+        Concurrent first messages (retries, several tabs) race here; ON
+        CONFLICT lets every request end up with the same session, which the
+        caller selects afterwards.
+        """
+        stmt = (
+            insert(self.model)
+            .values(**self._column_values(create_schema))
+            .on_conflict_do_nothing(index_elements=[self.model.user_email])
+        )
+        await db.execute(stmt)
+        await db.commit()
@@ -8,7 +8,11 @@ from app.entities.schema.prompts_schema import (
     PromptSchema
 )
 from app.entities.repositories.base_repository import BaseRepository
+from app.entities.repositories.async_base_repository import AsyncBaseRepository
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from typing import List, Optional
 
 
 class PromptsRepo(BaseRepository[PromptModel, PromptCreateSchema, PromptUpdateSchema]):
@@ -31,3 +35,32 @@ class PromptsRepo(BaseRepository[PromptModel, PromptCreateSchema, PromptUpdateSc
 
     def update_prompt(self, db: Session, prompt_id: int, prompt: PromptUpdateSchema) -> PromptSchema:
         return self.update_by_id(db, id=prompt_id, update_schema=prompt)
+
+
+class AsyncPromptsRepo(AsyncBaseRepository[PromptModel, PromptCreateSchema, PromptUpdateSchema]):
+    def __init__(self):
+        super().__init__(PromptModel, PromptSchema)
+
+    async def get_latest_prompt_by_type(
+        self, db: AsyncSession, type: PromptType
+    ) -> Optional[PromptSchema]:
+        db_obj = (
+            await db.scalars(
+                select(PromptModel)
+                .where(PromptModel.type == type)
+                .order_by(PromptModel.created_at.desc())
+                .limit(1)
+            )
+        ).first()
+        if not db_obj:
+            return None
+        return self.model_schema.model_validate(db_obj)
+
+    async def get_active_prompts(self, db: AsyncSession) -> List[PromptSchema]:
+        """Active prompts of every type, newest first"""
+        db_objs = await db.scalars(
+            select(PromptModel)
+            .where(PromptModel.is_active.is_(True))
+            .order_by(PromptModel.created_at.desc(), PromptModel.id.desc())
+        )
+        return [self.model_schema.model_validate(obj) for obj in db_objs]
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
 
 
 class ChatMessageBaseSchema(BaseModel):
@@ -18,7 +19,7 @@ class ChatMessageUpdateSchema(ChatMessageCreateSchema):
 
 class ChatMessageSchema(ChatMessageUpdateSchema):
     created_at: datetime
-    updated_at: datetime
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -1,11 +1,11 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class ChatSessionBaseSchema(BaseModel):
     user_email: str
-    meta_data: Dict[str, Any]
+    meta_data: Optional[Dict[str, Any]] = None
 
 
 class ChatSessionCreateSchema(ChatSessionBaseSchema):
@@ -18,7 +18,7 @@ class ChatSessionUpdateSchema(ChatSessionCreateSchema):
 
 class ChatSessionSchema(ChatSessionUpdateSchema):
     created_at: datetime
-    updated_at: datetime
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
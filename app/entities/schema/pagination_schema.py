@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+ItemType = TypeVar("ItemType")
+
+
+class PageSchema(BaseModel, Generic[ItemType]):
+    items: List[ItemType]
+    # Opaque cursor for the following page, None on the last page
+    next_cursor: Optional[str] = None
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
 from app.entities.models.prompts import PromptType
 
 
@@ -19,7 +20,7 @@ class PromptUpdateSchema(PromptCreateSchema):
 
 class PromptSchema(PromptUpdateSchema):
     created_at: datetime
-    updated_at: datetime
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
\ No newline at end of file
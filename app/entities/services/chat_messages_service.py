@@ -1,6 +1,10 @@
-from typing import List
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.entities.repositories.chat_messages_repo import ChatMessageRepository
+from app.entities.repositories.chat_messages_repo import (
+    AsyncChatMessageRepository,
+    ChatMessageRepository,
+)
 from app.entities.schema.chat_messages_schema import (
     ChatMessageCreateSchema,
     ChatMessageUpdateSchema,
@@ -13,8 +17,10 @@ class ChatMessagesService:
         self.db = db
         self.repository = ChatMessageRepository()
 
-    def get_by_session_id(self, session_id: int) -> List[ChatMessageSchema]:
-        return self.repository.get_by_session_id(self.db, session_id)
+    def get_by_session_id(
+        self, session_id: int, after_id: Optional[int] = None
+    ) -> List[ChatMessageSchema]:
+        return self.repository.get_by_session_id(self.db, session_id, after_id)
 
     def create(self, create_schema: ChatMessageCreateSchema) -> ChatMessageSchema:
         return self.repository.create(self.db, create_schema)
@@ -24,3 +30,20 @@ class ChatMessagesService:
 
     def delete(self, id: int) -> ChatMessageSchema:
         return self.repository.remove_by_id(self.db, id)
+
+
+class AsyncChatMessagesService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = AsyncChatMessageRepository()
+
+    async def get_by_session_id(
+        self,
+        session_id: int,
+        after_id: Optional[int] = None,
+        up_to_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[ChatMessageSchema]:
+        return await self.repository.get_by_session_id(
+            self.db, session_id, after_id, up_to_id, limit
+        )
@@ -1,10 +1,16 @@
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.entities.repositories.chat_sessions_repo import ChatSessionsRepository
+from app.entities.repositories.chat_sessions_repo import (
+    AsyncChatSessionsRepository,
+    ChatSessionsRepository,
+)
 from app.entities.schema.chat_sessions_schema import (
     ChatSessionCreateSchema,
     ChatSessionUpdateSchema,
     ChatSessionSchema,
 )
+from app.entities.schema.chat_messages_schema import ChatMessageSchema
 
 
 class ChatSessionsService:
@@ -15,11 +21,43 @@ class ChatSessionsService:
     def get_by_user_email(self, user_email: str) -> ChatSessionSchema:
         return self.repository.get_by_user_email(self.db, user_email)
 
+    def get_with_recent_messages(
+        self, user_email: str, limit: int
+    ) -> Optional[Tuple[ChatSessionSchema, List[ChatMessageSchema]]]:
+        return self.repository.get_with_recent_messages(self.db, user_email, limit)
+
     def create(self, create_schema: ChatSessionCreateSchema) -> ChatSessionSchema:
         return self.repository.create(self.db, create_schema)
 
     def update(self, update_schema: ChatSessionUpdateSchema) -> ChatSessionSchema:
         return self.repository.update_by_id(self.db, update_schema)
 
+    def update_meta_data(self, id: int, meta_data: Dict[str, Any]) -> ChatSessionSchema:
+        return self.repository.update_by_id(
+            self.db, id=id, update_schema={"meta_data": meta_data}
+        )
+
     def delete(self, id: int) -> ChatSessionSchema:
         return self.repository.remove_by_id(self.db, id)
+
+
+class AsyncChatSessionsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = AsyncChatSessionsRepository()
+
+    async def get_with_recent_messages(
+        self, user_email: str, limit: int
+    ) -> Optional[Tuple[ChatSessionSchema, List[ChatMessageSchema]]]:
+        return await self.repository.get_with_recent_messages(self.db, user_email, limit)
+
+    async def create(self, create_schema: ChatSessionCreateSchema) -> ChatSessionSchema:
+        return await self.repository.create(self.db, create_schema)
+
+    async def create_if_missing(self, create_schema: ChatSessionCreateSchema) -> None:
+        await self.repository.create_if_missing(self.db, create_schema)
+
+    async def update_meta_data(self, id: int, meta_data: Dict[str, Any]) -> ChatSessionSchema:
+        return await self.repository.update_by_id(
+            self.db, id=id, update_schema={"meta_data": meta_data}
+        )
@@ -1,32 +1,58 @@
-from typing import List
+import asyncio
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 from app.entities.schema.chat_sessions_schema import (
     ChatSessionSchema,
     ChatSessionCreateSchema,
     ChatSessionUpdateSchema,
 )
 from sqlalchemy.orm import Session
-from app.entities.services.chat_sessions_service import ChatSessionsService
-from app.entities.services.chat_messages_service import ChatMessagesService
+from app.entities.services.chat_sessions_service import (
+    AsyncChatSessionsService,
+    ChatSessionsService,
+)
+from app.entities.services.chat_messages_service import (
+    AsyncChatMessagesService,
+    ChatMessagesService,
+)
+from app.entities.services.pipeline import Pipeline
 from app.entities.schema.chat_messages_schema import (
     ChatMessageCreateSchema,
     ChatMessageSchema,
 )
+from app.entities.models.prompts import PromptType
 from app.agents.sql_generator import SQLGeneratorAgent
 from app.agents.response_generator import ResponseGeneratorAgent
-from app.clients.db.azure_sql_client import AzureSQLClient
+from app.agents.result_formatter import ResultFormatter
+from app.agents.history_manager import HistoryWindow
+from app.clients.db.postgres_client import AsyncSessionLocal
+from app.clients.registry import ClientRegistry
+from app.cache.result_cache import normalize_sql
+from app.core.config import settings
+from app.cache.sql_query_cache import normalize_question
 from app.monitoring.logging import get_logger
 
 logger = get_logger(__name__)
 
 
 class ConversationsService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, clients: ClientRegistry):
         self.db = db
         self.chat_sessions_service = ChatSessionsService(db)
         self.chat_messages_service = ChatMessagesService(db)
-        self.sql_generator_agent = SQLGeneratorAgent(db)
-        self.response_generator_agent = ResponseGeneratorAgent(db)
-        self.azure_sql_client = AzureSQLClient()
+        self.sql_generator_agent = SQLGeneratorAgent(
+            db, clients.llm_client, clients.sql_query_cache, clients.prompt_registry
+        )
+        self.response_generator_agent = ResponseGeneratorAgent(
+            db, clients.llm_client, clients.prompt_registry
+        )
+        self.prompt_registry = clients.prompt_registry
+        self.result_formatter = ResultFormatter()
+        self.azure_sql_client = clients.azure_sql_client
+        self.result_cache = clients.result_cache
+        self.single_flight = clients.single_flight
+        self.history_manager = clients.history_manager
+        self.message_buffer = clients.message_buffer
+        self.session_cache = clients.session_cache
 
     def get_conversation_by_user_email(self, user_email: str) -> ChatSessionSchema:
         return self.chat_sessions_service.get_by_user_email(user_email)
@@ -41,17 +67,101 @@ class ConversationsService:
     ) -> ChatSessionSchema:
         return self.chat_sessions_service.update(update_schema)
 
+    async def get_history_window(self, user_email: str) -> HistoryWindow:
+        """Load the bounded history for the user's session, creating the session
+        on first contact"""
+        cached = self.session_cache.get(user_email)
+        if cached:
+            conversation, messages = cached
+        else:
+            stamp = self.session_cache.stamp()
+            async with AsyncSessionLocal() as db:
+                sessions = AsyncChatSessionsService(db)
+                # Session and its latest messages in a single query
+                found = await sessions.get_with_recent_messages(
+                    user_email, settings.HISTORY_FETCH_MESSAGES
+                )
+                if not found:
+                    # A concurrent first message may create it too, both get the same row
+                    await sessions.create_if_missing(
+                        ChatSessionCreateSchema(user_email=user_email, meta_data={})
+                    )
+                    found = await sessions.get_with_recent_messages(
+                        user_email, settings.HISTORY_FETCH_MESSAGES
+                    )
+                conversation, messages = found
+            self.session_cache.put(user_email, conversation, messages, stamp)
+        return self.history_manager.build_window(
+            conversation.id,
+            conversation.meta_data,
+            messages,
+            self.message_buffer.pending_for(conversation.id),
+        )
+
+    def record_turn(self, session_id: Optional[int], message: str, response: str) -> None:
+        """Queue the question and answer for persistence without waiting on the DB"""
+        if session_id is None:
+            return
+        self.message_buffer.add(
+            [
+                ChatMessageCreateSchema(session_id=session_id, role="user", content=message),
+                ChatMessageCreateSchema(
+                    session_id=session_id, role="assistant", content=response
+                ),
+            ]
+        )
+
+    async def save_history_summary(self, session_id: int, meta_data: Dict[str, Any]) -> None:
+        # Runs after the request finished, so it uses its own DB session
+        async with AsyncSessionLocal() as db:
+            await AsyncChatSessionsService(db).update_meta_data(session_id, meta_data)
+        self.session_cache.update_meta_data(session_id, meta_data)
+
+    async def load_unsummarized_messages(
+        self, session_id: int, after_id: int, up_to_id: int
+    ) -> List[ChatMessageSchema]:
+        # Capped so a long unsummarized backlog is folded in over several turns
+        async with AsyncSessionLocal() as db:
+            return await AsyncChatMessagesService(db).get_by_session_id(
+                session_id, after_id, up_to_id, settings.HISTORY_FETCH_MESSAGES
+            )
+
     def add_message_to_conversation(
         self, message_schema: ChatMessageCreateSchema
     ) -> ChatMessageSchema:
         return self.chat_messages_service.create(message_schema)
 
     async def generate_sql_query(self, message: str) -> str:
-        sql_response = await self.sql_generator_agent.generate_sql_query(message)
+        # Identical questions in flight at the same time share one LLM call
+        version = self.prompt_registry.get(PromptType.SQL_GENERATOR).version
+        key = f"sql:{version}:{normalize_question(message)}"
+        sql_response = await self.single_flight.do(
+            key, lambda: self.sql_generator_agent.generate_sql_query(message)
+        )
         return sql_response.query
 
+    async def _execute_sql_query(self, sql_query: str) -> Dict[str, Any]:
+        cached = await self.result_cache.get(sql_query)
+        if cached is not None:
+            logger.info("Serving query result from cache")
+            return cached
+        query_result = await self.azure_sql_client.execute_query_safe_async(
+            sql_query, sample_size=settings.AZURE_SQL_SAMPLE_ROWS
+        )
+        await self.result_cache.set(sql_query, query_result)
+        return query_result
+
+    async def execute_sql_query(self, sql_query: str) -> Dict[str, Any]:
+        """Execute the query against Azure SQL, serving repeated queries from cache.
+
+        Concurrent requests for the same normalized SQL share one execution.
+        """
+        return await self.single_flight.do(
+            f"query:{normalize_sql(sql_query)}", lambda: self._execute_sql_query(sql_query)
+        )
+
     async def generate_response(
-        self, message: str, sql_results: str, message_history: List[ChatMessageSchema]
+        self, message: str, sql_results: str, message_history: List[Dict[str, Any]]
     ) -> str:
         response = await self.response_generator_agent.generate_response(
             user_message=message,
@@ -60,39 +170,128 @@ class ConversationsService:
         )
         return response.response
 
-    async def answer(self, message: str, user_email: str) -> str:
-        # Generate SQL query
-        sql_query = await self.generate_sql_query(message)
-        logger.info(f"Generated SQL Query: {sql_query}")
-
-        # Execute SQL query against Azure SQL Database
-        query_result = self.azure_sql_client.execute_query_safe(sql_query)
-        logger.info(f"Query execution result: {query_result}")
-
-        # Format query results for the AI
-        if query_result["success"]:
-            formatted_results = {
-                "success": True,
-                "row_count": query_result["row_count"],
-                "data": query_result["data"][:10],  # Limit to first 10 rows for AI processing
-                "columns": query_result.get("columns", [])
-            }
-        else:
-            formatted_results = {
-                "success": False,
-                "error": query_result["error"],
-                "data": []
-            }
-
-        # Get conversation context
-        conversation = self.get_conversation_by_user_email(user_email=user_email)
-        logger.info(f"Conversation: {conversation}")
-
-        # Generate natural language response
-        response = await self.generate_response(
-            message=message,
-            sql_results=str(formatted_results),
-            message_history=conversation.messages if conversation else [],
+    def format_query_result(self, query_result: Dict[str, Any]) -> str:
+        """Format query results for the AI as a compact, token-budgeted table"""
+        return self.result_formatter.format(query_result)
+
+    def build_answer_pipeline(
+        self,
+        message: str,
+        user_email: str,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Pipeline:
+        """Build the stages gathering the response context.
+
+        History loading runs concurrently with SQL generation. on_progress
+        receives status events as the stages advance.
+        """
+
+        def emit(event: Dict[str, Any]) -> None:
+            if on_progress:
+                on_progress(event)
+
+        async def generate_sql() -> str:
+            emit({"event": "status", "stage": "generating_sql"})
+            sql_query = await self.generate_sql_query(message)
+            logger.info(f"Generated SQL Query: {sql_query}")
+            return sql_query
+
+        async def run_query(sql: str) -> Dict[str, Any]:
+            # Execute SQL query against Azure SQL Database
+            emit({"event": "status", "stage": "querying"})
+            query_result = await self.execute_sql_query(sql)
+            logger.info(f"Query execution result: {query_result}")
+            emit(
+                {
+                    "event": "rows",
+                    "success": query_result["success"],
+                    "row_count": query_result.get("row_count", 0),
+                }
+            )
+            return query_result
+
+        async def load_history() -> HistoryWindow:
+            # Get conversation context
+            window = await self.get_history_window(user_email)
+            logger.info(
+                f"History window: {len(window.messages)} message(s), "
+                f"{len(window.pending)} pending summarization"
+            )
+            return window
+
+        return (
+            Pipeline("answer")
+            .add("sql", generate_sql)
+            .add("history", load_history)
+            .add("query", run_query, depends_on=["sql"])
         )
+
+    async def answer(
+        self,
+        message: str,
+        user_email: str,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> str:
+        async def respond(query: Dict[str, Any], history: HistoryWindow) -> str:
+            # Generate natural language response
+            if on_progress:
+                on_progress({"event": "status", "stage": "generating_response"})
+            response = await self.generate_response(
+                message=message,
+                sql_results=self.format_query_result(query),
+                message_history=history.messages,
+            )
+            self.record_turn(history.session_id, message, response)
+            self.history_manager.schedule_summary(
+                history, self.save_history_summary, self.load_unsummarized_messages
+            )
+            return response
+
+        pipeline = self.build_answer_pipeline(message, user_email, on_progress)
+        pipeline.add("response", respond, depends_on=["query", "history"])
+        result = await pipeline.run()
+        response = result["response"]
         logger.info(f"Final Response: {response}")
         return response
+
+    async def answer_stream(
+        self, message: str, user_email: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield progress events while the context is gathered, then the response tokens"""
+        events: asyncio.Queue = asyncio.Queue()
+        pipeline_task = asyncio.create_task(
+            self.build_answer_pipeline(message, user_email, events.put_nowait).run()
+        )
+        try:
+            while not pipeline_task.done() or not events.empty():
+                next_event = asyncio.ensure_future(events.get())
+                done, _ = await asyncio.wait(
+                    {next_event, pipeline_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_event in done:
+                    yield next_event.result()
+                else:
+                    next_event.cancel()
+            result = pipeline_task.result()
+
+            yield {"event": "status", "stage": "generating_response"}
+            history = result["history"]
+            chunks = []
+            async for token in self.response_generator_agent.stream_response(
+                user_message=message,
+                sql_results=self.format_query_result(result["query"]),
+                message_history=history.messages,
+            ):
+                chunks.append(token)
+                yield {"event": "token", "text": token}
+
+            response = "".join(chunks)
+            self.record_turn(history.session_id, message, response)
+            self.history_manager.schedule_summary(
+                history, self.save_history_summary, self.load_unsummarized_messages
+            )
+            logger.info(f"Final Response: {response}")
+            yield {"event": "done", "response": response}
+        finally:
+            if not pipeline_task.done():
+                pipeline_task.cancel()
@@ -0,0 +1,120 @@
+import asyncio
+from typing import Callable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.clients.db.postgres_client import AsyncSessionLocal
+from app.entities.repositories.chat_messages_repo import AsyncChatMessageRepository
+from app.entities.schema.chat_messages_schema import (
+    ChatMessageCreateSchema,
+    ChatMessageSchema,
+)
+from app.core.config import settings
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class MessageWriteBuffer:
+    """Write-behind buffer persisting chat messages off the request path.
+
+    add() only appends to memory. A background task writes the buffered
+    messages with one multi-row INSERT when max_size messages are waiting or
+    every flush_interval seconds, whichever comes first. Failed batches are
+    kept for the next flush, up to max_pending messages. on_persisted, if
+    given, receives the stored messages of every successful flush.
+    """
+
+    def __init__(
+        self,
+        max_size: int = None,
+        flush_interval: float = None,
+        max_pending: int = None,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        on_persisted: Optional[Callable[[List[ChatMessageSchema]], None]] = None,
+    ):
+        self.max_size = max_size or settings.MESSAGE_BUFFER_MAX_SIZE
+        self.flush_interval = flush_interval or settings.MESSAGE_BUFFER_FLUSH_INTERVAL
+        self.max_pending = max_pending or settings.MESSAGE_BUFFER_MAX_PENDING
+        self.session_factory = session_factory
+        self.repository = AsyncChatMessageRepository()
+        self.on_persisted = on_persisted
+        self._buffer: List[ChatMessageCreateSchema] = []
+        # Batch currently being written, still visible to pending_for()
+        self._in_flight: List[ChatMessageCreateSchema] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def _ensure_started(self) -> None:
+        # Created lazily so the buffer can be built outside a running loop
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._task = asyncio.create_task(self._run())
+
+    def add(self, messages: List[ChatMessageCreateSchema]) -> None:
+        """Queue messages for persistence; they keep their relative order"""
+        if self._closed:
+            logger.error(f"Message buffer closed, dropping {len(messages)} message(s)")
+            return
+        self._ensure_started()
+        self._buffer.extend(messages)
+        if len(self._buffer) >= self.max_size:
+            self._wakeup.set()
+
+    def pending_for(self, session_id: int) -> List[ChatMessageCreateSchema]:
+        """Messages of a session accepted but not yet committed, oldest first"""
+        return [m for m in self._in_flight + self._buffer if m.session_id == session_id]
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write everything buffered so far in a single INSERT"""
+        if self._flush_lock is None:
+            return
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            self._in_flight = batch
+            try:
+                stored = await self._write(batch)
+                logger.info(f"Persisted {len(batch)} chat message(s)")
+            except Exception as e:
+                logger.error(f"Failed to persist {len(batch)} chat message(s): {e}")
+                # Keep them for the next flush unless the backlog is already too large
+                retained = (batch + self._buffer)[-self.max_pending:]
+                dropped = len(batch) + len(self._buffer) - len(retained)
+                if dropped:
+                    logger.error(f"Message backlog full, dropped {dropped} message(s)")
+                self._buffer = retained
+            else:
+                if self.on_persisted:
+                    self.on_persisted(stored)
+            finally:
+                self._in_flight = []
+
+    async def _write(self, batch: List[ChatMessageCreateSchema]) -> List[ChatMessageSchema]:
+        async with self.session_factory() as db:
+            return await self.repository.create_bulk(db, batch)
+
+    async def close(self) -> None:
+        """Stop the background flusher and write what is still buffered"""
+        self._closed = True
+        if self._task is None:
+            return
+        # Cancel between flushes, never in the middle of a write
+        async with self._flush_lock:
+            self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        await self.flush()
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
+from app.monitoring.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class PipelineResult:
+    def __init__(self, results: Dict[str, Any], timings: Dict[str, float], total: float):
+        self.results = results
+        # Seconds spent inside each stage, excluding time waiting on dependencies
+        self.timings = timings
+        self.total = total
+
+    def __getitem__(self, stage: str) -> Any:
+        return self.results[stage]
+
+
+class Pipeline:
+    """Dependency-aware runner for async stages.
+
+    Each stage starts as soon as the stages it depends on have finished and
+    receives their results as keyword arguments, so independent stages run
+    concurrently. If any stage fails, the remaining ones are cancelled and
+    the error is re-raised.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._stages: Dict[str, tuple] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        depends_on: Iterable[str] = (),
+    ) -> "Pipeline":
+        depends_on = list(depends_on)
+        for dep in depends_on:
+            if dep not in self._stages:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+        self._stages[name] = (func, depends_on)
+        return self
+
+    async def run(self) -> PipelineResult:
+        tasks: Dict[str, asyncio.Task] = {}
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+
+        async def run_stage(name: str, func: Callable[..., Awaitable[Any]], deps: List[str]):
+            kwargs = {dep: await tasks[dep] for dep in deps}
+            stage_started = time.perf_counter()
+            try:
+                return await func(**kwargs)
+            finally:
+                timings[name] = time.perf_counter() - stage_started
+
+        # Stages are registered in dependency order, so every dependency task exists
+        for name, (func, deps) in self._stages.items():
+            tasks[name] = asyncio.create_task(
+                run_stage(name, func, deps), name=f"{self.name}:{name}"
+            )
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        total = time.perf_counter() - started
+        results = {name: task.result() for name, task in tasks.items()}
+        logger.info(
+            f"Pipeline '{self.name}' finished in {total:.3f}s: "
+            + ", ".join(f"{name}={seconds:.3f}s" for name, seconds in timings.items())
+        )
+        return PipelineResult(results, timings, total)
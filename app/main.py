@@ -1,10 +1,14 @@
 # import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.clients.db.postgres_client import Base, engine
+from app.clients.registry import ClientRegistry
+from app.bot.activity_queue import ConversationWorkQueue
+from app.bot.activity_dedup import build_activity_deduplicator
 from app.monitoring.logging import get_logger
 from fastapi.responses import JSONResponse
 from app.entities.api.v1.routes.chatbot_routes import chatbot_router
@@ -15,8 +19,27 @@ logger = get_logger(__name__)
 
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared LLM/SQL clients, injected into requests via get_clients
+    app.state.clients = ClientRegistry()
+    await app.state.clients.start()
+    # Background workers answering Teams messages after the webhook is acknowledged
+    app.state.bot_work_queue = ConversationWorkQueue(
+        max_workers=settings.BOT_WORKERS,
+        max_pending=settings.BOT_MAX_PENDING_ACTIVITIES,
+    )
+    # Recognises Bot Framework redeliveries of the same activity
+    app.state.activity_deduplicator = build_activity_deduplicator()
+    yield
+    await app.state.bot_work_queue.shutdown()
+    # Release pooled connections on shutdown
+    await app.state.clients.close()
+
+
 # App Setup
-app = FastAPI(title=settings.PROJECT_NAME)
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -33,6 +56,12 @@ app.include_router(
 app.include_router(bot_router, prefix="/api", tags=["bot"])
 
 
+@app.get("/health/azure-sql")
+async def azure_sql_health():
+    # Connection pool usage and exhaustion counters
+    return JSONResponse(content=app.state.clients.azure_sql_client.pool_stats())
+
+
 @app.get("/health")
 async def root():
     try:
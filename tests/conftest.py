@@ -0,0 +1,25 @@
+import os
+
+# Settings are read at import time; unit tests never reach these services
+for name in (
+    "POSTGRES_USER",
+    "POSTGRES_PASSWORD",
+    "POSTGRES_HOST",
+    "POSTGRES_DB",
+    "AZURE_OPENAI_API_KEY",
+    "AZURE_RESOURCE_SECRET_ID",
+    "AZURE_RESOURCE_SECRET_KEY",
+    "AZURE_CLIENT_ID",
+    "AZURE_TENANT_ID",
+    "AZURE_DB_HOST",
+    "AZURE_DATABASE",
+    "AZURE_DB_USER",
+    "AZURE_DB_PASSWORD",
+):
+    os.environ.setdefault(name, "test")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com")
+
+# Mappers are configured together, so load every model like the app does
+import app.entities.models.chat_messages  # noqa: E402,F401
+import app.entities.models.chat_sessions  # noqa: E402,F401
@@ -0,0 +1,109 @@
+import asyncio
+from typing import Dict, Optional
+import pytest
+from app.bot.activity_dedup import InMemoryActivityDeduplicator, RedisActivityDeduplicator
+
+
+class FakeRedis:
+    """The subset of redis.asyncio used by RedisActivityDeduplicator"""
+
+    def __init__(self):
+        self.data: Dict[str, str] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int = None) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+
+def build(kind: str):
+    if kind == "memory":
+        return InMemoryActivityDeduplicator()
+    return RedisActivityDeduplicator(FakeRedis(), poll_interval=0.01)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def kind(request):
+    return request.param
+
+
+def test_duplicate_while_first_is_in_flight(kind):
+    async def main():
+        dedup = build(kind)
+        release = asyncio.Event()
+        computed, delivered = [], []
+
+        async def compute():
+            computed.append(1)
+            await release.wait()
+            return "reply"
+
+        async def deliver(reply):
+            delivered.append(reply)
+
+        first = asyncio.create_task(dedup.run("c:1", compute, deliver))
+        await asyncio.sleep(0.02)
+        second = asyncio.create_task(dedup.run("c:1", compute, deliver))
+        await asyncio.sleep(0.02)
+        release.set()
+        return await first, await second, computed, delivered
+
+    first, second, computed, delivered = asyncio.run(main())
+    assert (first, second) == (False, True)
+    assert len(computed) == 1
+    assert delivered == ["reply"]
+
+
+def test_duplicate_redelivers_when_original_delivery_failed(kind):
+    async def main():
+        dedup = build(kind)
+        delivered = []
+
+        async def compute():
+            return "reply"
+
+        async def broken(reply):
+            raise ConnectionError("teams unavailable")
+
+        async def deliver(reply):
+            delivered.append(reply)
+
+        with pytest.raises(ConnectionError):
+            await dedup.run("c:1", compute, broken)
+        duplicate = await dedup.run("c:1", compute, deliver)
+        again = await dedup.run("c:1", compute, deliver)
+        return duplicate, again, delivered
+
+    duplicate, again, delivered = asyncio.run(main())
+    assert duplicate and again
+    assert delivered == ["reply"]
+
+
+def test_failed_compute_lets_a_redelivery_retry(kind):
+    async def main():
+        dedup = build(kind)
+        attempts = []
+
+        async def compute():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("pipeline failed")
+            return "reply"
+
+        async def deliver(reply):
+            pass
+
+        with pytest.raises(RuntimeError):
+            await dedup.run("c:1", compute, deliver)
+        return await dedup.run("c:1", compute, deliver), attempts
+
+    duplicate, attempts = asyncio.run(main())
+    assert duplicate is False
+    assert len(attempts) == 2
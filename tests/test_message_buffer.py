@@ -0,0 +1,115 @@
+import asyncio
+from datetime import datetime
+from typing import List
+from app.entities.schema.chat_messages_schema import (
+    ChatMessageCreateSchema,
+    ChatMessageSchema,
+)
+from app.entities.services.message_buffer import MessageWriteBuffer
+
+
+def message(content: str, session_id: int = 1) -> ChatMessageCreateSchema:
+    return ChatMessageCreateSchema(session_id=session_id, role="user", content=content)
+
+
+class Store:
+    """Stands in for the database write, optionally held until released"""
+
+    def __init__(self):
+        self.rows: List[ChatMessageSchema] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.fail = False
+
+    async def write(self, batch: List[ChatMessageCreateSchema]) -> List[ChatMessageSchema]:
+        await self.release.wait()
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        stored = [
+            ChatMessageSchema(
+                id=len(self.rows) + i + 1, created_at=datetime.now(), **m.model_dump()
+            )
+            for i, m in enumerate(batch)
+        ]
+        self.rows.extend(stored)
+        return stored
+
+
+def build(store: Store, persisted: list) -> MessageWriteBuffer:
+    buffer = MessageWriteBuffer(
+        max_size=100, flush_interval=60, max_pending=100, on_persisted=persisted.extend
+    )
+    buffer._write = store.write
+    return buffer
+
+
+def contents(messages) -> List[str]:
+    return [m.content for m in messages]
+
+
+def test_messages_stay_visible_until_handed_to_on_persisted():
+    async def main():
+        store, persisted = Store(), []
+        buffer = build(store, persisted)
+        # Whatever the caller sees, each message is either pending or persisted
+        seen = []
+
+        def on_persisted(stored):
+            seen.append(contents(buffer.pending_for(1)))
+            persisted.extend(stored)
+
+        buffer.on_persisted = on_persisted
+
+        buffer.add([message("q1"), message("a1")])
+        store.release.clear()
+        flush = asyncio.create_task(buffer.flush())
+        await asyncio.sleep(0)
+        buffer.add([message("q2"), message("a2"), message("other", session_id=2)])
+        # The batch being written comes before messages added meanwhile
+        during = contents(buffer.pending_for(1))
+        store.release.set()
+        await flush
+        after = contents(buffer.pending_for(1))
+        await buffer.close()
+        return during, seen, after, persisted
+
+    during, seen, after, persisted = asyncio.run(main())
+    assert during == ["q1", "a1", "q2", "a2"]
+    assert seen[0] == ["q1", "a1", "q2", "a2"]
+    assert after == ["q2", "a2"]
+    assert contents(persisted) == ["q1", "a1", "q2", "a2", "other"]
+
+
+def test_failed_batch_is_written_before_newer_messages():
+    async def main():
+        store, persisted = Store(), []
+        buffer = build(store, persisted)
+        buffer.add([message("q1"), message("a1")])
+        store.fail = True
+        await buffer.flush()
+        pending = contents(buffer.pending_for(1))
+        buffer.add([message("q2")])
+        store.fail = False
+        await buffer.flush()
+        await buffer.close()
+        return pending, store.rows, persisted
+
+    pending, rows, persisted = asyncio.run(main())
+    assert pending == ["q1", "a1"]
+    assert contents(rows) == ["q1", "a1", "q2"]
+    assert [m.id for m in rows] == [1, 2, 3]
+    assert contents(persisted) == ["q1", "a1", "q2"]
+
+
+def test_close_writes_what_is_buffered_and_rejects_new_messages():
+    async def main():
+        store, persisted = Store(), []
+        buffer = build(store, persisted)
+        buffer.add([message("q1")])
+        await buffer.close()
+        buffer.add([message("late")])
+        return store.rows, buffer.pending_for(1)
+
+    rows, pending = asyncio.run(main())
+    assert contents(rows) == ["q1"]
+    assert pending == []
@@ -0,0 +1,58 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+import pytest
+from app.entities.models.prompts import PromptModel, PromptType
+from app.entities.repositories.base_repository import (
+    column_python_type,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+@pytest.mark.parametrize(
+    "value, python_type",
+    [
+        (datetime(2024, 3, 1, 12, 30, 15, 123456), datetime),
+        (datetime(2024, 3, 1, 12, 30, tzinfo=timezone(timedelta(hours=-3))), datetime),
+        (date(2024, 2, 29), date),
+        (PromptType.RESPONSE_GENERATOR, PromptType),
+        (Decimal("1234.50"), Decimal),
+        (Decimal("0.1"), Decimal),
+        (2.5, float),
+        (42, int),
+        ("loja centro", str),
+        (None, Decimal),
+    ],
+)
+def test_cursor_round_trip(value, python_type):
+    cursor = encode_cursor(["key", "id"], [value, 7])
+    decoded = decode_cursor(cursor, ["key", "id"], [python_type, int])
+    assert decoded == [value, 7]
+    assert type(decoded[0]) is type(value)
+
+
+def test_cursor_keeps_decimal_precision():
+    cursor = encode_cursor(["amount"], [Decimal("0.30")])
+    (amount,) = decode_cursor(cursor, ["amount"], [Decimal])
+    assert str(amount) == "0.30"
+
+
+def test_column_types_drive_decoding():
+    assert column_python_type(PromptModel, "type") is PromptType
+    assert column_python_type(PromptModel, "created_at") is datetime
+    cursor = encode_cursor(["type", "id"], [PromptType.SQL_GENERATOR, 3])
+    types = [column_python_type(PromptModel, name) for name in ("type", "id")]
+    assert decode_cursor(cursor, ["type", "id"], types) == [PromptType.SQL_GENERATOR, 3]
+
+
+@pytest.mark.parametrize(
+    "cursor, order_by",
+    [
+        (encode_cursor(["type", "id"], ["sql_generator", 3]), ["created_at", "id"]),
+        (encode_cursor(["amount"], ["not a number"]), ["amount"]),
+        ("not-a-cursor", ["amount"]),
+    ],
+)
+def test_invalid_cursor_raises_value_error(cursor, order_by):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, order_by, [Decimal] * len(order_by))
@@ -0,0 +1,56 @@
+from app.clients.db.query_result import (
+    ColumnStats,
+    ColumnarResult,
+    ResultAggregator,
+    unique_column_names,
+)
+
+
+def test_unnamed_expressions_keep_their_own_columns():
+    # pyodbc reports "" for SELECT SUM(x), COUNT(*)
+    result = ColumnarResult([])
+    result.append_rows(["", ""], [(1, 2), (3, 4)])
+
+    assert result.columns == ["col_1", "col_2"]
+    assert len(result) == 2
+    assert result.to_records() == [{"col_1": 1, "col_2": 2}, {"col_1": 3, "col_2": 4}]
+
+
+def test_repeated_column_names_stay_aligned():
+    result = ColumnarResult([])
+    result.append_rows(["loja", "total", "loja"], [("A", 10, "B"), ("C", 20, "D")])
+    result.append_rows(["loja", "total", "loja"], [("E", 30, "F")])
+
+    assert result.columns == ["loja", "total", "loja_2"]
+    assert len(result) == 3
+    assert list(result.column("loja")) == ["A", "C", "E"]
+    assert list(result.column("loja_2")) == ["B", "D", "F"]
+    assert list(result.rows())[2] == ("E", 30, "F")
+
+
+def test_generated_names_do_not_collide_with_real_ones():
+    assert unique_column_names(["a", "a", "a_2"]) == ["a", "a_3", "a_2"]
+    assert unique_column_names(["", "col_1"]) == ["col_2", "col_1"]
+
+
+def test_aggregates_keep_unnamed_expressions_apart():
+    aggregator = ResultAggregator()
+    aggregator.add_rows(["", ""], [(1, 100), (3, 300)])
+
+    summary = aggregator.summary()
+    assert summary["col_1"]["sum"] == 4
+    assert summary["col_2"]["min"] == 100
+
+
+def test_value_counts_skip_numbers_and_stop_at_the_cap():
+    numbers = ColumnStats()
+    numbers.add(range(1000))
+    assert not numbers.counts
+    assert numbers.summary()["sum"] == sum(range(1000))
+
+    ids = ColumnStats(max_distinct=10)
+    ids.add(["a"] * 5 + [f"id{i}" for i in range(100)])
+    assert len(ids.counts) == 10
+    summary = ids.summary(top_k=1)
+    assert summary["distinct"] == ">10"
+    assert summary["top"] == [("a", 5)]
@@ -0,0 +1,94 @@
+import asyncio
+import pytest
+from app.utils.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    async def main():
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "sql"
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+        return calls, results
+
+    calls, results = asyncio.run(main())
+    assert calls == 1
+    assert results == ["sql"] * 5
+
+
+def test_error_reaches_every_waiter_and_is_not_cached():
+    async def main():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fail():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("llm down")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+        # The failed call is forgotten, the next caller runs the work again
+        with pytest.raises(ValueError):
+            await flight.do("k", fail)
+        return calls, results
+
+    calls, results = asyncio.run(main())
+    assert calls == 2
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_cancelled_waiter_leaves_the_others_running():
+    async def main():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "sql"
+
+        first = asyncio.create_task(flight.do("k", work))
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == "sql"
+
+
+def test_work_is_cancelled_when_every_waiter_is():
+    async def main():
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiters = [asyncio.create_task(flight.do("k", work)) for _ in range(2)]
+        await started.wait()
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.sleep(0)
+        return flight._calls
+
+    assert asyncio.run(main()) == {}
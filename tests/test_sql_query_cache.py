@@ -0,0 +1,48 @@
+import pytest
+from app.cache.sql_query_cache import TokenSetMatcher, normalize_question
+
+
+def matches(question: str, candidate: str) -> bool:
+    return TokenSetMatcher().matches(
+        normalize_question(question), normalize_question(candidate)
+    )
+
+
+def test_filler_words_match():
+    assert matches(
+        "Quais as 10 lojas com maior receita em 2024?",
+        "quais 10 lojas com maior receita em 2024",
+    )
+
+
+@pytest.mark.parametrize(
+    "question, candidate",
+    [
+        (
+            "qual a loja com a maior receita liquida do departamento de bebidas em 2024",
+            "qual a loja com a menor receita liquida do departamento de bebidas em 2024",
+        ),
+        (
+            "qual a receita bruta total das lojas do departamento de bebidas em janeiro de 2024",
+            "qual a receita bruta total das lojas do departamento de bebidas em fevereiro de 2024",
+        ),
+        (
+            "quantos produtos do departamento de bebidas da loja centro com ruptura em 2024",
+            "quantos produtos do departamento de bebidas da loja centro sem ruptura em 2024",
+        ),
+        (
+            "quais produtos do departamento de bebidas da loja centro tiveram ruptura em 2024",
+            "quais produtos do departamento de bebidas da loja centro nao tiveram ruptura em 2024",
+        ),
+        (
+            "qual a receita bruta total do departamento de bebidas da loja centro em 2024",
+            "qual a receita bruta total do departamento de bebidas da loja norte em 2024",
+        ),
+        (
+            "quais as top 5 lojas por receita bruta do departamento de bebidas em 2024",
+            "quais as top 10 lojas por receita bruta do departamento de bebidas em 2024",
+        ),
+    ],
+)
+def test_opposite_meaning_questions_do_not_match(question, candidate):
+    assert not matches(question, candidate)